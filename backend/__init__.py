@@ -0,0 +1,7 @@
+# backend/__init__.py
+import sys
+
+from backend.sheets import register_sheets
+
+# backend.sheet0 ... backend.sheet4
+register_sheets(sys.modules[__name__])
@@ -1,9 +1,31 @@
 # backend/commonBackend.py
 from backend.db import get_connection, close_connection
+import json
 import re
+import threading
 from typing import List, Dict, Optional, Any
 
 
+# ==================== GROUP DATA VERSIONS ====================
+
+# group_id -> write counter, bumped after a group's attendance, marks, responses or
+# comments are saved, so caches keyed on (group_id, version) miss after a write
+_group_data_versions: Dict[str, int] = {}
+_group_data_versions_lock = threading.Lock()
+
+
+def get_group_data_version(group_id: str) -> int:
+    """Current write counter for a group (0 until its data is first written)"""
+    return _group_data_versions.get(group_id, 0)
+
+
+def bump_group_data_version(*group_ids: str) -> None:
+    """Mark the given groups' cached data as stale"""
+    with _group_data_versions_lock:
+        for group_id in group_ids:
+            _group_data_versions[group_id] = _group_data_versions.get(group_id, 0) + 1
+
+
 # ==================== SECURITY UTILITIES ====================
 
 def validate_review_number(review_number: int) -> bool:
@@ -161,6 +183,7 @@ def update_review_attendance(review_number: int, group_id: str, attendance: List
             cursor.execute(query, (present, roll_no, group_id))
 
         conn.commit()
+        bump_group_data_version(group_id)
         print(f"Attendance updated for group {group_id} - Review {review_number}")
         return True
 
@@ -225,8 +248,7 @@ def save_review_marks(review_number: int, marks_list: List[Dict]) -> bool:
 
     try:
         cursor = conn.cursor(dictionary=True)
-        updated_count = 0
-        inserted_count = 0
+        saved_groups = set()
         
         # Get table name safely
         table_name = sanitize_table_name(review_number, 'marks')
@@ -251,6 +273,19 @@ def save_review_marks(review_number: int, marks_list: List[Dict]) -> bool:
                 print(f"Invalid criteria column name: {col}")
                 return False
         
+        # Build dynamic column list once; every row uses the same statement
+        columns_str = ', '.join(criteria_columns)
+        placeholders = ', '.join(['%s'] * len(criteria_columns))
+        update_str = ', '.join([f"{col} = VALUES({col})" for col in criteria_columns])
+        
+        query = f"""
+            INSERT INTO {table_name} 
+            (group_id, roll_no, {columns_str})
+            VALUES (%s, %s, {placeholders})
+            ON DUPLICATE KEY UPDATE {update_str}
+        """
+        
+        rows = []
         for marks in marks_list:
             group_id = marks.get("group_id", "")
             roll_no = marks.get("roll_no", "")
@@ -260,11 +295,6 @@ def save_review_marks(review_number: int, marks_list: List[Dict]) -> bool:
                 print(f"Invalid group_id or roll_no: {group_id}, {roll_no}")
                 continue
             
-            # Build dynamic column list and values
-            columns_str = ', '.join(criteria_columns)
-            placeholders = ', '.join(['%s'] * len(criteria_columns))
-            update_str = ', '.join([f"{col} = VALUES({col})" for col in criteria_columns])
-            
             # Extract and validate values
             values = [group_id, roll_no]
             for col in criteria_columns:
@@ -277,22 +307,16 @@ def save_review_marks(review_number: int, marks_list: List[Dict]) -> bool:
                 else:
                     values.append(0)
             
-            query = f"""
-                INSERT INTO {table_name} 
-                (group_id, roll_no, {columns_str})
-                VALUES (%s, %s, {placeholders})
-                ON DUPLICATE KEY UPDATE {update_str}
-            """
-            
-            cursor.execute(query, values)
-            
-            if cursor.rowcount == 1:
-                inserted_count += 1
-            elif cursor.rowcount == 2:
-                updated_count += 1
+            rows.append(values)
+            saved_groups.add(group_id)
+        
+        # executemany sends all rows as one multi-row INSERT
+        if rows:
+            cursor.executemany(query, rows)
 
         conn.commit()
-        print(f"Review {review_number} Marks saved: {inserted_count} inserted, {updated_count} updated")
+        bump_group_data_version(*saved_groups)
+        print(f"Review {review_number} Marks saved: {len(rows)} rows")
         return True
 
     except Exception as e:
@@ -343,6 +367,50 @@ def get_review_marks(review_number: int, group_id: str) -> List[Dict]:
         close_connection(conn)
 
 
+def review_totals_query(review_numbers) -> str:
+    """
+    One query over several review marks tables: a row per review with a
+    roll_no -> total JSON object. Takes the group_id once per review.
+    """
+    return " UNION ALL ".join(
+        f"SELECT {review_num} AS review_num, JSON_OBJECTAGG(roll_no, total) AS marks "
+        f"FROM {sanitize_table_name(review_num, 'marks')} WHERE group_id = %s"
+        for review_num in review_numbers
+    )
+
+
+def get_review_marks_multi(review_numbers: tuple, group_id: str) -> Dict[str, Dict]:
+    """
+    Total marks for several reviews in one round-trip
+    Returns: {'review1': {roll_no: total, ...}, ...}
+    """
+    if not review_numbers or not all(validate_review_number(n) for n in review_numbers):
+        return {}
+    
+    if not validate_group_id(group_id):
+        return {}
+    
+    conn = get_connection()
+    if not conn:
+        return {}
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute(review_totals_query(review_numbers), (group_id,) * len(review_numbers))
+        
+        review_marks = {f'review{review_num}': {} for review_num in review_numbers}
+        for review_num, marks in cursor.fetchall():
+            review_marks[f'review{review_num}'] = json.loads(marks or '{}')
+        return review_marks
+
+    except Exception as e:
+        print(f"Error fetching marks for reviews {review_numbers}: {e}")
+        return {}
+
+    finally:
+        close_connection(conn)
+
+
 # ==================== RESPONSES FUNCTIONS ====================
 
 def save_review_responses(review_number: int, group_id: str, date: str, 
@@ -414,6 +482,7 @@ def save_review_responses(review_number: int, group_id: str, date: str,
         action = 'updated' if was_updated else 'inserted'
         
         conn.commit()
+        bump_group_data_version(group_id)
         print(f"Review {review_number} Responses {action}: Group={group_id}")
         
         return {
@@ -691,6 +760,90 @@ def check_pdf_data_availability(review_number: int, group_id: str) -> Dict[str,
         close_connection(conn)
 
 
+def check_pdf_data_availability_bulk(pairs: List[tuple]) -> Dict[tuple, Dict[str, Any]]:
+    """
+    Check PDF data availability for many (review_number, group_id) pairs at once.
+    Runs one query per table (projects, members and each distinct review's
+    responses) regardless of how many pairs are requested.
+    
+    Returns:
+        Dict mapping each (review_number, group_id) pair to the same result
+        check_pdf_data_availability would return for it
+    """
+    results = {}
+    valid_pairs = []
+    for review_number, group_id in pairs:
+        if not validate_review_number(review_number):
+            results[(review_number, group_id)] = {'available': False, 'error': 'Invalid review number'}
+        elif not validate_group_id(group_id):
+            results[(review_number, group_id)] = {'available': False, 'error': 'Invalid group ID'}
+        else:
+            valid_pairs.append((review_number, group_id))
+    
+    if not valid_pairs:
+        return results
+    
+    conn = get_connection()
+    if not conn:
+        for pair in valid_pairs:
+            results[pair] = {'available': False, 'error': 'Database connection failed'}
+        return results
+    
+    try:
+        cursor = conn.cursor()
+        
+        def existing_groups(table, group_ids):
+            # Case-folded, since group_id compares case-insensitively in the database
+            placeholders = ', '.join(['%s'] * len(group_ids))
+            cursor.execute(f"SELECT DISTINCT group_id FROM {table} WHERE group_id IN ({placeholders})", list(group_ids))
+            return {row[0].casefold() for row in cursor.fetchall()}
+        
+        all_groups = {group_id for _, group_id in valid_pairs}
+        groups_by_review = {}
+        for review_number, group_id in valid_pairs:
+            groups_by_review.setdefault(review_number, set()).add(group_id)
+        
+        projects = existing_groups('projects', all_groups)
+        members = existing_groups('members', all_groups)
+        
+        # A failing responses table (e.g. a review without one) only fails that review's pairs
+        responses = {}
+        for review_number, group_ids in groups_by_review.items():
+            try:
+                responses[review_number] = existing_groups(sanitize_table_name(review_number, 'group_responses'), group_ids)
+            except Exception as e:
+                print(f"Error checking review {review_number} responses: {e}")
+                responses[review_number] = e
+        
+        for review_number, group_id in valid_pairs:
+            key = group_id.casefold()
+            review_responses = responses[review_number]
+            if key not in projects:
+                result = {'available': False, 'error': f'Project not found for group {group_id}'}
+            elif key not in members:
+                result = {'available': False, 'error': f'No members found for group {group_id}'}
+            elif isinstance(review_responses, Exception):
+                result = {'available': False, 'error': str(review_responses)}
+            elif key not in review_responses:
+                result = {'available': False, 'error': f'No review {review_number} responses found for group {group_id}'}
+            else:
+                result = {'available': True, 'message': 'All required data is available'}
+            results[(review_number, group_id)] = result
+        
+        return results
+    
+    except Exception as e:
+        print(f"Error checking PDF data availability: {e}")
+        import traceback
+        traceback.print_exc()
+        for pair in valid_pairs:
+            results[pair] = {'available': False, 'error': str(e)}
+        return results
+    
+    finally:
+        close_connection(conn)
+
+
 def log_pdf_generation(review_number: int, group_id: str, 
                        generated_by: str = None, 
                        ip_address: str = None,
@@ -745,7 +898,66 @@ def log_pdf_generation(review_number: int, group_id: str,
     
     finally:
         close_connection(conn)
+
+
+
+def log_pdf_generations(entries: List[tuple]) -> bool:
+    """
+    Log a batch of PDF generations with one multi-row insert
+    
+    Args:
+        entries: (review_number, group_id, generated_by, ip_address, user_agent) tuples
+    """
+    rows = [
+        (
+            review_number,
+            group_id,
+            generated_by[:100] if generated_by else None,
+            ip_address[:45] if ip_address else None,
+            user_agent[:500] if user_agent else None
+        )
+        for review_number, group_id, generated_by, ip_address, user_agent in entries
+        if validate_review_number(review_number) and validate_group_id(group_id)
+    ]
+    if not rows:
+        return False
+    
+    conn = get_connection()
+    if not conn:
+        return False
+    
+    try:
+        cursor = conn.cursor()
+        
+        # Check if table exists first
+        cursor.execute("""
+            SELECT COUNT(*) as count
+            FROM information_schema.tables 
+            WHERE table_schema = DATABASE() 
+            AND table_name = 'pdf_generation_logs'
+        """)
         
+        if cursor.fetchone()[0] == 0:
+            print("Warning: pdf_generation_logs table does not exist. Skipping logging.")
+            return False
+        
+        cursor.executemany("""
+            INSERT INTO pdf_generation_logs 
+            (review_number, group_id, generated_by, ip_address, user_agent)
+            VALUES (%s, %s, %s, %s, %s)
+        """, rows)
+        
+        conn.commit()
+        print(f"Logged {len(rows)} PDF generation(s)")
+        return True
+    
+    except Exception as e:
+        conn.rollback()
+        print(f"Error logging PDF generations: {e}")
+        return False
+    
+    finally:
+        close_connection(conn)        
         
 # ==================== ATTENDANCE DASHBOARD FUNCTIONS ====================
 
@@ -1,6 +1,6 @@
 # simplified_data_manager.py
 
-from flask import Blueprint, render_template, request, jsonify, send_file, session, redirect, url_for
+from flask import Blueprint, Response, render_template, request, jsonify, send_file, session, redirect, url_for
 import logging
 import io
 import pandas as pd
@@ -8,10 +8,13 @@ import mysql.connector
 from datetime import datetime
 import re
 import json
+from collections import defaultdict
 import base64
 import openpyxl
 import os
 import hashlib
+import queue
+import threading
 import backend.db as db
 import backend.auth as auth
 
@@ -19,6 +22,9 @@ admin_required = auth.admin_required
 
 logger = logging.getLogger(__name__)
 
+# Separators used between professor names in the panel column
+_PANEL_SPLIT = re.compile(r'[|,\n]+')
+
 
 bp = Blueprint('data_manager', __name__, template_folder='templates')
 
@@ -455,6 +461,7 @@ def process_all_data_with_normalization(div_a, div_b, sched):
     cur.execute("DELETE FROM members")
     cur.execute("DELETE FROM projects")
     conn.commit()
+    _division_row_keys.clear()
     
     # Process divisions with normalization
     div_a_groups, div_a_members = process_division_enhanced_with_normalization(div_a, 'A')
@@ -747,6 +754,52 @@ def import_excel():
         logger.error(f"Import error: {str(e)}", exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# cell_updates is an append-only edit log; the latest value for a cell is the
+# newest row for (sheet_name, row_num, col_num), served by idx_cell
+CELL_UPDATE_INSERT_SQL = """
+    INSERT INTO cell_updates (sheet_name, row_num, col_num, old_value, new_value)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+_cell_updates_table_ready = False
+
+def ensure_cell_updates_table(cursor):
+    """Create the general cell updates table if it doesn't exist"""
+    global _cell_updates_table_ready
+    if _cell_updates_table_ready:
+        return
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS cell_updates (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            sheet_name VARCHAR(100),
+            row_num INT,
+            col_num INT,
+            old_value TEXT,
+            new_value TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_cell (sheet_name, row_num, col_num, updated_at DESC)
+        )
+    """)
+    
+    # Older databases still carry the unique key from the upsert-based schema
+    cursor.execute("""
+        SELECT INDEX_NAME FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'cell_updates'
+        AND INDEX_NAME IN ('unique_cell', 'idx_cell')
+    """)
+    indexes = {row['INDEX_NAME'] if isinstance(row, dict) else row[0] for row in cursor.fetchall()}
+    alterations = []
+    if 'unique_cell' in indexes:
+        alterations.append("DROP INDEX unique_cell")
+    if 'idx_cell' not in indexes:
+        alterations.append("ADD INDEX idx_cell (sheet_name, row_num, col_num, updated_at DESC)")
+    if alterations:
+        cursor.execute(f"ALTER TABLE cell_updates {', '.join(alterations)}")
+        logger.info(f"Migrated cell_updates indexes: {', '.join(alterations)}")
+    
+    _cell_updates_table_ready = True
+
 @bp.route('/api/update-cell-general', methods=['POST'])
 def update_cell_general():
     """Update any cell in the Excel sheets and sync with database"""
@@ -763,28 +816,10 @@ def update_cell_general():
         cur = conn.cursor()
         
         # Create a general cell updates table if it doesn't exist
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS cell_updates (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                sheet_name VARCHAR(100),
-                row_num INT,
-                col_num INT,
-                old_value TEXT,
-                new_value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE KEY unique_cell (sheet_name, row_num, col_num)
-            )
-        """)
+        ensure_cell_updates_table(cur)
         
         # Store the cell update
-        cur.execute("""
-            INSERT INTO cell_updates (sheet_name, row_num, col_num, old_value, new_value)
-            VALUES (%s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE 
-            old_value = VALUES(old_value),
-            new_value = VALUES(new_value),
-            updated_at = CURRENT_TIMESTAMP
-        """, (sheet_name, row, col, old_value, new_value))
+        cur.execute(CELL_UPDATE_INSERT_SQL, (sheet_name, row, col, old_value, new_value))
         
         # Try to update specific database tables based on sheet and content
         try:
@@ -809,6 +844,87 @@ def update_cell_general():
         logger.error(f"General cell update error: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@bp.route('/api/update-cells-bulk', methods=['POST'])
+def update_cells_bulk():
+    """Apply a batch of cell edits (e.g. a pasted range) in one transaction"""
+    try:
+        data = request.get_json() or {}
+        updates = data.get('updates', [])
+        
+        if not updates:
+            return jsonify({'success': False, 'error': 'No cell updates provided'}), 400
+        
+        for u in updates:
+            if not u.get('sheet_name') or not isinstance(u.get('row'), int) or not isinstance(u.get('col'), int):
+                return jsonify({'success': False, 'error': 'Each update needs sheet_name, row and col'}), 400
+        
+        cells = [
+            (u.get('sheet_name'), u.get('row'), u.get('col'), u.get('old_value', ''), u.get('value', ''))
+            for u in updates
+        ]
+        
+        conn = db.get_connection()
+        cur = conn.cursor()
+        
+        try:
+            ensure_cell_updates_table(cur)
+            
+            # One round-trip for the whole batch of audit rows
+            cur.executemany(CELL_UPDATE_INSERT_SQL, cells)
+            
+            for sheet_name, row, col, _, new_value in cells:
+                try:
+                    update_specific_database_field(cur, sheet_name, row, col, new_value)
+                except Exception as e:
+                    logger.warning(f"Could not update specific database field: {e}")
+            
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            # Row keys loaded during the transaction may hold rolled-back group_ids
+            _division_row_keys.clear()
+            raise
+        finally:
+            cur.close()
+            conn.close()
+        
+        # Apply all edits to the stored admin file with a single load/save
+        update_admin_file_cells([(sheet_name, row, col, new_value) for sheet_name, row, col, _, new_value in cells])
+        
+        return jsonify({
+            'success': True,
+            'updated': len(cells),
+            'message': f'Updated {len(cells)} cells'
+        })
+        
+    except Exception as e:
+        logger.error(f"Bulk cell update error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def update_admin_file_cells(cell_updates):
+    """Update several cells in the stored admin Excel file with one save"""
+    try:
+        if not os.path.exists(ADMIN_FILE_PATH):
+            return
+        
+        wb = openpyxl.load_workbook(ADMIN_FILE_PATH)
+        sheets_by_upper = {ws_name.upper(): wb[ws_name] for ws_name in wb.sheetnames}
+        
+        for sheet_name, row, col, new_value in cell_updates:
+            ws = sheets_by_upper.get(sheet_name.upper())
+            if not ws:
+                continue
+            try:
+                # openpyxl uses 1-based indexing
+                ws.cell(row=row + 1, column=col + 1, value=new_value)
+            except Exception as e:
+                logger.warning(f"Could not update admin file cell {row},{col} in {sheet_name}: {e}")
+        
+        wb.save(ADMIN_FILE_PATH)
+        
+    except Exception as e:
+        logger.warning(f"Could not update admin file: {e}")
+
 def update_admin_file_cell(sheet_name, row, col, new_value):
     """Update a cell in the stored admin Excel file"""
     try:
@@ -835,20 +951,60 @@ def update_admin_file_cell(sheet_name, row, col, new_value):
     except Exception as e:
         logger.warning(f"Could not update admin file: {e}")
 
+# Upper-cased sheet name -> 'DIV_A' / 'DIV_B' / 'SCHEDULE' / None. Sheet names are
+# stable for a loaded workbook, so each one is classified once.
+SHEET_KIND = {}
+
+def classify_sheet(sheet_name):
+    """Classify an editable sheet by name, memoizing the keyword scan"""
+    sheet_upper = sheet_name.upper()
+    if sheet_upper not in SHEET_KIND:
+        if any(keyword in sheet_upper for keyword in ['DIV A', 'DIVA', 'DIVISION A']):
+            kind = 'DIV_A'
+        elif any(keyword in sheet_upper for keyword in ['DIV B', 'DIVB', 'DIVISION B']):
+            kind = 'DIV_B'
+        elif any(keyword in sheet_upper for keyword in ['SCHEDULE', 'SCHED']):
+            kind = 'SCHEDULE'
+        else:
+            kind = None
+        SHEET_KIND[sheet_upper] = kind
+    return SHEET_KIND[sheet_upper]
+
 def update_specific_database_field(cursor, sheet_name, row, col, new_value):
     """Update specific database fields based on sheet position"""
-    sheet_upper = sheet_name.upper()
+    sheet_kind = classify_sheet(sheet_name)
     
     # Handle Division A/B sheets
-    if any(keyword in sheet_upper for keyword in ['DIV A', 'DIVA', 'DIVISION A']):
-        division = 'A'
-        update_division_field(cursor, division, row, col, new_value)
-    elif any(keyword in sheet_upper for keyword in ['DIV B', 'DIVB', 'DIVISION B']):
-        division = 'B'
-        update_division_field(cursor, division, row, col, new_value)
-    elif any(keyword in sheet_upper for keyword in ['SCHEDULE', 'SCHED']):
+    if sheet_kind == 'DIV_A':
+        update_division_field(cursor, 'A', row, col, new_value)
+    elif sheet_kind == 'DIV_B':
+        update_division_field(cursor, 'B', row, col, new_value)
+    elif sheet_kind == 'SCHEDULE':
         update_schedule_field(cursor, row, col, new_value)
 
+# Sheet row position -> primary key, loaded once per (division, table) and
+# reused for every subsequent edit until the data is re-imported
+_division_row_keys = {}
+
+def get_division_row_keys(cursor, division, table):
+    """Return the ordered primary keys backing the rows of a division sheet"""
+    cache_key = (division, table)
+    if cache_key not in _division_row_keys:
+        if table == 'projects':
+            cursor.execute(
+                "SELECT group_id FROM projects WHERE division = %s ORDER BY group_id",
+                (division,)
+            )
+        else:
+            cursor.execute("""
+                SELECT m.member_id FROM members m
+                JOIN projects p ON m.group_id = p.group_id
+                WHERE p.division = %s
+                ORDER BY m.group_id, m.member_id
+            """, (division,))
+        _division_row_keys[cache_key] = [row[0] for row in cursor.fetchall()]
+    return _division_row_keys[cache_key]
+
 def update_division_field(cursor, division, row, col, new_value):
     """Update fields in projects/members tables based on position"""
     # Common column mappings for division sheets
@@ -872,34 +1028,35 @@ def update_division_field(cursor, division, row, col, new_value):
         return
     
     try:
+        table = 'members' if field_name in ['roll_no', 'student_name', 'contact_details'] else 'projects'
+        row_keys = get_division_row_keys(cursor, division, table)
+        if row - 1 >= len(row_keys):
+            logger.warning(f"No {table} row at position {row} in division {division}")
+            return
+        row_key = row_keys[row - 1]
+        
         if field_name == 'group_id':
             # Update projects table directly
-            cursor.execute("""
-                UPDATE projects SET group_id = %s 
-                WHERE division = %s AND group_id = (
-                    SELECT old_group_id FROM (
-                        SELECT group_id as old_group_id FROM projects 
-                        WHERE division = %s LIMIT 1 OFFSET %s
-                    ) as temp
-                )
-            """, (new_value, division, division, row - 1))
-        elif field_name in ['roll_no', 'student_name', 'contact_details']:
+            cursor.execute(
+                "UPDATE projects SET group_id = %s WHERE group_id = %s",
+                (new_value, row_key)
+            )
+            # Reload both key lists on next use (inside this transaction they see the
+            # new group_id; the rollback paths clear them again)
+            _division_row_keys.pop((division, 'projects'), None)
+            _division_row_keys.pop((division, 'members'), None)
+        elif table == 'members':
             # Update members table
-            cursor.execute("""
-                UPDATE members m
-                JOIN projects p ON m.group_id = p.group_id
-                SET m.{} = %s
-                WHERE p.division = %s
-                LIMIT 1 OFFSET %s
-            """.format(field_name), (new_value, division, row - 1))
-        elif field_name in ['project_domain', 'project_title', 'sponsor_company', 'guide_name']:
+            cursor.execute(
+                "UPDATE members SET {} = %s WHERE member_id = %s".format(field_name),
+                (new_value, row_key)
+            )
+        else:
             # Update projects table
-            cursor.execute("""
-                UPDATE projects 
-                SET {} = %s 
-                WHERE division = %s 
-                LIMIT 1 OFFSET %s
-            """.format(field_name), (new_value, division, row - 1))
+            cursor.execute(
+                "UPDATE projects SET {} = %s WHERE group_id = %s".format(field_name),
+                (new_value, row_key)
+            )
             
     except Exception as e:
         logger.warning(f"Could not update {field_name} in division {division}: {e}")
@@ -969,11 +1126,9 @@ def export_formatted_excel():
         if not os.path.exists(ADMIN_FILE_PATH):
             return jsonify({'success': False, 'error': 'No stored file found'}), 404
         
-        # Load the original workbook with all formatting preserved
-        wb = openpyxl.load_workbook(ADMIN_FILE_PATH)
-        
-        # Get database data for updates
+        # Get database data for updates from one consistent snapshot
         conn = db.get_connection()
+        conn.start_transaction(readonly=True, isolation_level='REPEATABLE READ')
         cursor = conn.cursor(dictionary=True)
         
         cursor.execute("""
@@ -987,7 +1142,17 @@ def export_formatted_excel():
             WHERE (p.group_id IS NOT NULL OR m.roll_no IS NOT NULL)
             ORDER BY p.division, p.group_id, m.roll_no
         """)
-        database_data = cursor.fetchall()
+        
+        # Fingerprint the stored file and the exported rows to detect unchanged exports
+        stat = os.stat(ADMIN_FILE_PATH)
+        digest = hashlib.sha256(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+        
+        # Index student rows by division and group once, keeping the query order
+        groups_by_division = defaultdict(lambda: defaultdict(list))
+        for row in cursor:
+            digest.update(repr(tuple(row.values())).encode())
+            if row.get('roll_no') and row.get('student_name'):
+                groups_by_division[row['division']][row['group_id']].append(row)
         
         # Get panel assignments
         cursor.execute("""
@@ -998,49 +1163,135 @@ def export_formatted_excel():
         """)
         schedule_data = cursor.fetchall()
         
+        conn.commit()
         cursor.close()
         conn.close()
         
+        for row in schedule_data:
+            digest.update(repr(tuple(row.values())).encode())
+        export_key = digest.hexdigest()
+        
+        mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        download_name = f'formatted_project_data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+        
+        # Nothing changed since the last export - reuse its bytes instead of rebuilding
+        cached = get_cached_formatted_export(export_key)
+        if cached is not None:
+            logger.info("Serving formatted export from cache")
+            return send_file(
+                io.BytesIO(cached),
+                as_attachment=True,
+                download_name=download_name,
+                mimetype=mimetype
+            )
+        
+        # Load the original workbook with all formatting preserved
+        wb = openpyxl.load_workbook(ADMIN_FILE_PATH)
+        
         # Update each sheet while preserving formatting
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
-            sheet_upper = sheet_name.upper()
+            sheet_kind = classify_sheet(sheet_name)
             
-            if any(keyword in sheet_upper for keyword in ['DIV A', 'DIVA', 'DIVISION A']):
-                update_division_sheet_formatted(ws, database_data, 'A')
-            elif any(keyword in sheet_upper for keyword in ['DIV B', 'DIVB', 'DIVISION B']):
-                update_division_sheet_formatted(ws, database_data, 'B')
-            elif any(keyword in sheet_upper for keyword in ['SCHEDULE', 'SCHED']):
+            if sheet_kind == 'DIV_A':
+                update_division_sheet_formatted(ws, groups_by_division['A'], 'A')
+            elif sheet_kind == 'DIV_B':
+                update_division_sheet_formatted(ws, groups_by_division['B'], 'B')
+            elif sheet_kind == 'SCHEDULE':
                 update_schedule_sheet_formatted(ws, schedule_data)
         
-        # Save to buffer
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
-        return send_file(
-            output,
-            as_attachment=True,
-            download_name=f'formatted_project_data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        # Serialize in a background thread and stream chunks as they are produced
+        return Response(
+            cache_formatted_export(export_key, stream_workbook(wb)),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename={download_name}'}
         )
         
     except Exception as e:
         logger.error(f"Formatted export error: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
-def update_division_sheet_formatted(ws, data, division):
+# Last formatted export, keyed by a hash of the stored file and the DB rows it was built from
+_formatted_export_cache = {'key': None, 'data': None}
+_formatted_export_lock = threading.Lock()
+
+def get_cached_formatted_export(export_key):
+    """Return the cached export bytes if they were built from the same data"""
+    with _formatted_export_lock:
+        if _formatted_export_cache['key'] == export_key:
+            return _formatted_export_cache['data']
+    return None
+
+def cache_formatted_export(export_key, chunks):
+    """Pass workbook chunks through, caching the complete file once the stream finishes"""
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    
+    with _formatted_export_lock:
+        _formatted_export_cache['key'] = export_key
+        _formatted_export_cache['data'] = b''.join(parts)
+
+class WorkbookChunkWriter:
+    """Write-only file object that hands saved workbook bytes to a response generator"""
+    
+    def __init__(self, chunk_size=64 * 1024):
+        self.chunk_size = chunk_size
+        self.chunks = queue.Queue()
+        self._buffer = bytearray()
+    
+    def write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= self.chunk_size:
+            self.chunks.put(bytes(self._buffer))
+            self._buffer.clear()
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def finish(self, error=None):
+        """Push any remaining bytes followed by the end-of-stream marker"""
+        if self._buffer:
+            self.chunks.put(bytes(self._buffer))
+            self._buffer.clear()
+        self.chunks.put(error)
+
+def stream_workbook(wb, chunk_size=64 * 1024):
+    """Save the workbook on a worker thread and yield the xlsx bytes as they are written"""
+    writer = WorkbookChunkWriter(chunk_size)
+    
+    def save():
+        try:
+            wb.save(writer)
+            writer.finish()
+        except Exception as e:
+            logger.error(f"Workbook serialization error: {e}")
+            writer.finish(e)
+    
+    threading.Thread(target=save, daemon=True).start()
+    
+    while True:
+        chunk = writer.chunks.get()
+        if chunk is None:
+            return
+        if isinstance(chunk, Exception):
+            raise chunk
+        yield chunk
+
+def update_division_sheet_formatted(ws, groups, division):
     """Update division sheet data while preserving all original formatting"""
-    # Filter and group data by division
-    division_data = [row for row in data if row['division'] == division]
+    # groups maps group_id -> student rows for this division, already in sheet order
     
     # Find the header row by looking for "Group No." or similar
     header_row = None
     data_start_row = 5  # Default fallback
     
-    for row_num in range(1, min(15, ws.max_row + 1)):
-        for col_num in range(1, 5):
-            cell_value = ws.cell(row=row_num, column=col_num).value
+    # Scan the header block in one bulk pass instead of per-cell ws.cell() lookups
+    header_rows = ws.iter_rows(min_row=1, max_row=min(14, ws.max_row), max_col=4, values_only=True)
+    for row_num, row_values in enumerate(header_rows, start=1):
+        for cell_value in row_values:
             if cell_value and any(keyword in str(cell_value).upper() for keyword in ['GROUP NO', 'ROLL NO', 'NAME OF']):
                 header_row = row_num
                 data_start_row = row_num + 1
@@ -1049,25 +1300,23 @@ def update_division_sheet_formatted(ws, data, division):
             break
     
     current_row = data_start_row
-    current_group = None
-    group_start_row = None
     
-    for row_data in division_data:
-        # Only process rows that have student data
-        if row_data.get('roll_no') and row_data.get('student_name'):
+    for group_id, students in groups.items():
+        group_start_row = current_row
+        first = students[0]
+        
+        try:
+            # Update group-level information
+            update_cell_preserve_format(ws, group_start_row, 1, group_id)
+            update_cell_preserve_format(ws, group_start_row, 5, first.get('project_domain', ''))
+            update_cell_preserve_format(ws, group_start_row, 6, first.get('project_title', ''))
+            update_cell_preserve_format(ws, group_start_row, 7, first.get('sponsor_company', ''))
+            update_cell_preserve_format(ws, group_start_row, 8, first.get('guide_name', ''))
+        except Exception as e:
+            logger.warning(f"Error updating division {division} group {group_id}: {e}")
+        
+        for row_data in students:
             try:
-                # Check if we're starting a new group
-                if row_data['group_id'] != current_group:
-                    current_group = row_data['group_id']
-                    group_start_row = current_row
-                    
-                    # Update group-level information
-                    update_cell_preserve_format(ws, group_start_row, 1, row_data['group_id'])
-                    update_cell_preserve_format(ws, group_start_row, 5, row_data.get('project_domain', ''))
-                    update_cell_preserve_format(ws, group_start_row, 6, row_data.get('project_title', ''))
-                    update_cell_preserve_format(ws, group_start_row, 7, row_data.get('sponsor_company', ''))
-                    update_cell_preserve_format(ws, group_start_row, 8, row_data.get('guide_name', ''))
-                
                 # Update student-level information
                 update_cell_preserve_format(ws, current_row, 2, row_data.get('roll_no', ''))
                 update_cell_preserve_format(ws, current_row, 3, row_data.get('student_name', ''))
@@ -1089,9 +1338,9 @@ def update_schedule_sheet_formatted(ws, schedule_data):
     header_row = None
     data_start_row = 3  # Default
     
-    for row_num in range(1, min(10, ws.max_row + 1)):
-        for col_num in range(1, 5):
-            cell_value = ws.cell(row=row_num, column=col_num).value
+    header_rows = ws.iter_rows(min_row=1, max_row=min(9, ws.max_row), max_col=4, values_only=True)
+    for row_num, row_values in enumerate(header_rows, start=1):
+        for cell_value in row_values:
             if cell_value and ('Track' in str(cell_value) or 'track' in str(cell_value).lower()):
                 header_row = row_num
                 data_start_row = row_num + 1
@@ -1128,8 +1377,7 @@ def update_schedule_sheet_formatted(ws, schedule_data):
                 # Clean up panel professors text
                 panel_text = track_info['panel_professors']
                 if panel_text:
-                    panel_text = panel_text.replace('|', '\n').replace(',', '\n')
-                    panel_lines = [line.strip() for line in panel_text.split('\n') if line.strip()]
+                    panel_lines = [line.strip() for line in _PANEL_SPLIT.split(panel_text) if line.strip()]
                     panel_text = '\n'.join(panel_lines)
                 
                 update_cell_preserve_format(ws, current_row, 2, panel_text)
@@ -1157,13 +1405,6 @@ def update_cell_preserve_format(ws, row, col, value):
             
         cell = ws.cell(row=row, column=col)
         
-        # Store original formatting
-        original_font = cell.font
-        original_alignment = cell.alignment
-        original_border = cell.border
-        original_fill = cell.fill
-        original_number_format = cell.number_format
-        
         # Handle None values and clean up the value
         if value is None:
             value = ''
@@ -1176,38 +1417,10 @@ def update_cell_preserve_format(ws, row, col, value):
             if value.lower() in ['none', 'null', 'nan']:
                 value = ''
         
-        # Update value
+        # Assigning the value leaves font, alignment, border, fill and
+        # number format untouched, so no style restore is needed
         cell.value = value
         
-        # Restore formatting
-        from openpyxl.styles import Font, Alignment
-        
-        if original_font:
-            cell.font = Font(
-                name=original_font.name,
-                size=original_font.size,
-                bold=original_font.bold,
-                italic=original_font.italic,
-                vertAlign=original_font.vertAlign,
-                underline=original_font.underline,
-                strike=original_font.strike,
-                color=original_font.color
-            )
-        
-        if original_alignment:
-            cell.alignment = Alignment(
-                horizontal=original_alignment.horizontal,
-                vertical=original_alignment.vertical,
-                text_rotation=original_alignment.text_rotation,
-                wrap_text=original_alignment.wrap_text,
-                shrink_to_fit=original_alignment.shrink_to_fit,
-                indent=original_alignment.indent
-            )
-        
-        cell.border = original_border
-        cell.fill = original_fill
-        cell.number_format = original_number_format
-        
     except Exception as e:
         logger.warning(f"Error updating cell {row},{col} with value '{value}': {e}")
 
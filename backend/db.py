@@ -1,8 +1,9 @@
 # backend/db.py
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 from dotenv import load_dotenv
 import os
+import threading
 
 # Load environment variables from .env
 load_dotenv()
@@ -13,26 +14,104 @@ DB_PORT = int(os.getenv("DB_PORT", 3306))
 DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
+# mysql-connector caps pools at 32 connections
+DB_POOL_SIZE = min(int(os.getenv("DB_POOL_SIZE", 25)), pooling.CNX_POOL_MAXSIZE)
+
+DB_CONFIG = {
+    "host": DB_HOST,
+    "port": DB_PORT,
+    "user": DB_USER,
+    "password": DB_PASSWORD,
+    "database": DB_NAME,
+    # Use the C extension for protocol parsing and row conversion when it is installed
+    # (mysql-connector falls back to the pure Python implementation otherwise)
+    "use_pure": False,
+}
+
+# Shared pool, created on first use so importing this module never touches the DB
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """Returns the shared connection pool, creating it on first call."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name="app",
+                    pool_size=DB_POOL_SIZE,
+                    pool_reset_session=True,
+                    **DB_CONFIG
+                )
+                print(f"✅ MySQL connection pool ready ({DB_POOL_SIZE} connections)")
+    return _pool
 
 def get_connection():
-    """Establishes and returns a MySQL database connection."""
+    """Returns a MySQL database connection from the shared pool."""
     try:
-        connection = mysql.connector.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME
-        )
-        if connection.is_connected():
-            print("✅ Connected to MySQL database")
-        return connection
+        return get_pool().get_connection()
+    except pooling.PoolError as e:
+        # Pool exhausted - fall back to a dedicated connection rather than failing the request
+        print(f"⚠️ Connection pool unavailable ({e}), opening a direct connection")
+        try:
+            return mysql.connector.connect(**DB_CONFIG)
+        except Error as e:
+            print(f"❌ Error connecting to MySQL: {e}")
+            return None
     except Error as e:
         print(f"❌ Error connecting to MySQL: {e}")
         return None
 
 def close_connection(connection):
-    """Closes the given database connection."""
+    """Closes the given database connection, returning pooled connections to the pool."""
     if connection and connection.is_connected():
         connection.close()
-        print("✅ MySQL connection closed")
+
+# Stored procedures are installed by final_Preview_Schema.sql (never by the app);
+# name -> whether the installed procedure carries the COMMENT version the app expects
+_procedures_available = {}
+_procedures_lock = threading.Lock()
+
+def procedure_available(connection, name, version):
+    """Whether stored procedure name is installed with COMMENT version (checked once per process)."""
+    with _procedures_lock:
+        if name not in _procedures_available:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("""
+                    SELECT ROUTINE_COMMENT FROM INFORMATION_SCHEMA.ROUTINES
+                    WHERE ROUTINE_SCHEMA = DATABASE() AND ROUTINE_TYPE = 'PROCEDURE' AND ROUTINE_NAME = %s
+                """, (name,))
+                row = cursor.fetchone()
+            except Error as e:
+                # Not cached: a transient failure shouldn't disable the procedure for good
+                print(f"⚠️ Could not check stored procedure {name}: {e}")
+                return False
+            finally:
+                cursor.close()
+            _procedures_available[name] = bool(row) and row[0] == version
+            if not _procedures_available[name]:
+                print(f"⚠️ Stored procedure {name} ({version}) not installed, using separate queries")
+        return _procedures_available[name]
+
+def call_procedure(connection, name, version, args):
+    """
+    Call a stored procedure installed by the schema and return (column_names, rows)
+    per result set, or None when it is unavailable or the call fails (callers then
+    run the equivalent queries themselves).
+    """
+    if not procedure_available(connection, name, version):
+        return None
+    cursor = connection.cursor()
+    try:
+        cursor.callproc(name, args)
+        return [(result.column_names, result.fetchall()) for result in cursor.stored_results()]
+    except Error as e:
+        # e.g. the procedure is being reinstalled; check again on next use
+        print(f"⚠️ Stored procedure {name} failed, using separate queries: {e}")
+        with _procedures_lock:
+            _procedures_available.pop(name, None)
+        return None
+    finally:
+        cursor.close()
@@ -5,12 +5,46 @@ Supports both development mode (console logging) and production mode (actual SMT
 """
 
 import os
+import atexit
 import logging
-from datetime import datetime
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from backend.otp_storage import otp_storage
 
 logger = logging.getLogger(__name__)
 
+# Email templates, filled with {otp} and {app} via str.format_map
+_REG_SUBJECT = "Verify Your Email - {app}"
+_REG_BODY = """
+Welcome to {app}!
+
+Your verification code is: {otp}
+
+This code will expire in 10 minutes.
+
+If you didn't request this code, please ignore this email.
+
+Best regards,
+{app} Team
+"""
+
+_RESET_SUBJECT = "Password Reset Code - {app}"
+_RESET_BODY = """
+Hello,
+
+You requested to reset your password for {app}.
+
+Your password reset code is: {otp}
+
+This code will expire in 10 minutes.
+
+If you didn't request this code, please ignore this email and your password will remain unchanged.
+
+Best regards,
+{app} Team
+"""
+
 class EmailService:
     """Handles email sending for OTP verification"""
     
@@ -19,6 +53,11 @@ class EmailService:
         # Check if we should use actual SMTP
         self.use_smtp = os.getenv('USE_SMTP', 'False').lower() == 'true'
         
+        # Development mode reports OTPs through the logger, so make sure they reach the console
+        if not self.use_smtp and not logger.handlers and not logging.getLogger().handlers:
+            logger.addHandler(logging.StreamHandler())
+            logger.setLevel(logging.INFO)
+        
         # SMTP Configuration (from .env file)
         self.smtp_server = os.getenv('SMTP_SERVER', '')
         self.smtp_port = int(os.getenv('SMTP_PORT', 587))
@@ -28,6 +67,14 @@ class EmailService:
         self.email_from = os.getenv('EMAIL_FROM', 'noreply@college.edu')
         
         self.app_name = "Project Review System"
+        
+        # Long-lived SMTP connection shared by all sends (guarded by _lock)
+        self._smtp = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+        
+        # OTP emails are delivered in the background so requests don't wait on SMTP
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='otp-email')
     
     def send_otp_email(self, email, otp, purpose='registration'):
         """
@@ -53,69 +100,87 @@ class EmailService:
     
     def _generate_email_content(self, otp, purpose):
         """Generate email subject and body"""
+        fields = {'otp': otp, 'app': self.app_name}
         if purpose == 'registration':
-            subject = f"Verify Your Email - {self.app_name}"
-            body = f"""
-Welcome to {self.app_name}!
-
-Your verification code is: {otp}
-
-This code will expire in 10 minutes.
-
-If you didn't request this code, please ignore this email.
-
-Best regards,
-{self.app_name} Team
-"""
-        else:  # password_reset
-            subject = f"Password Reset Code - {self.app_name}"
-            body = f"""
-Hello,
-
-You requested to reset your password for {self.app_name}.
-
-Your password reset code is: {otp}
-
-This code will expire in 10 minutes.
-
-If you didn't request this code, please ignore this email and your password will remain unchanged.
-
-Best regards,
-{self.app_name} Team
-"""
-        
-        return subject, body
+            return _REG_SUBJECT.format_map(fields), _REG_BODY.format_map(fields)
+        # password_reset
+        return _RESET_SUBJECT.format_map(fields), _RESET_BODY.format_map(fields)
     
     def _log_email_to_console(self, email, otp, purpose, subject, body):
         """
         Log email to console (development mode)
         This is perfect for local testing and college servers without SMTP
         """
-        print("\n" + "="*60)
-        print("📧 EMAIL SENT (Development Mode)")
-        print("="*60)
-        print(f"To: {email}")
-        print(f"Purpose: {purpose}")
-        print(f"Subject: {subject}")
-        print("-"*60)
-        print(f"🔐 YOUR OTP CODE: {otp}")
-        print("-"*60)
-        print(body)
-        print("="*60)
-        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*60 + "\n")
-        
-        logger.info(f"OTP sent to {email} (purpose: {purpose}): {otp}")
+        logger.info("OTP %s -> %s (%s) subject=%r", otp, email, purpose, subject)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(body)
         
         return True, "OTP sent successfully (check console)"
     
+    def _connect_smtp(self):
+        """Open, secure and authenticate a new SMTP connection"""
+        if self.smtp_use_tls:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.starttls()
+        else:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        
+        if self.smtp_username and self.smtp_password:
+            server.login(self.smtp_username, self.smtp_password)
+        
+        return server
+    
+    def _get_smtp(self):
+        """
+        Return the cached SMTP connection, reconnecting if it has gone stale.
+        Caller must hold self._lock.
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+        
+        self._smtp = self._connect_smtp()
+        return self._smtp
+    
+    def _close_smtp(self):
+        """Quit the cached SMTP connection, ignoring errors. Caller must hold self._lock."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+    
+    def close(self):
+        """Close the shared SMTP connection (registered with atexit)"""
+        with self._lock:
+            self._close_smtp()
+    
+    def _queue_otp_email(self, email, otp, purpose):
+        """Hand the OTP email to the background pool and log delivery failures"""
+        future = self._pool.submit(self.send_otp_email, email, otp, purpose)
+        
+        def _log_result(done):
+            try:
+                success, message = done.result()
+            except Exception as e:
+                success, message = False, str(e)
+            if not success:
+                logger.error(f"Background OTP email to {email} ({purpose}) failed: {message}")
+        
+        future.add_done_callback(_log_result)
+        return future
+    
     def _send_smtp_email(self, to_email, subject, body):
         """
         Send actual email via SMTP (production mode)
         Configure SMTP settings in .env file
         """
         try:
-            import smtplib
             from email.mime.text import MIMEText
             from email.mime.multipart import MIMEMultipart
             
@@ -127,19 +192,13 @@ Best regards,
             
             message.attach(MIMEText(body, 'plain'))
             
-            # Connect to SMTP server
-            if self.smtp_use_tls:
-                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-                server.starttls()
-            else:
-                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
-            
-            # Login and send
-            if self.smtp_username and self.smtp_password:
-                server.login(self.smtp_username, self.smtp_password)
-            
-            server.send_message(message)
-            server.quit()
+            # Reuse the open connection; reconnect once if it dropped mid-send
+            with self._lock:
+                try:
+                    self._get_smtp().send_message(message)
+                except (smtplib.SMTPServerDisconnected, OSError):
+                    self._close_smtp()
+                    self._get_smtp().send_message(message)
             
             logger.info(f"Email sent successfully to {to_email}")
             return True, "Email sent successfully"
@@ -164,13 +223,10 @@ Best regards,
         # Store OTP
         otp_storage.store_otp(email, otp, purpose='registration', expiry_minutes=10)
         
-        # Send email
-        success, message = self.send_otp_email(email, otp, purpose='registration')
+        # Send email without blocking the request
+        self._queue_otp_email(email, otp, 'registration')
         
-        if success:
-            return True, message, otp
-        else:
-            return False, message, None
+        return True, "OTP queued for delivery", otp
     
     def send_password_reset_otp(self, email):
         """
@@ -188,13 +244,10 @@ Best regards,
         # Store OTP
         otp_storage.store_otp(email, otp, purpose='password_reset', expiry_minutes=10)
         
-        # Send email
-        success, message = self.send_otp_email(email, otp, purpose='password_reset')
+        # Send email without blocking the request
+        self._queue_otp_email(email, otp, 'password_reset')
         
-        if success:
-            return True, message, otp
-        else:
-            return False, message, None
+        return True, "OTP queued for delivery", otp
     
     def verify_otp(self, email, otp, purpose='registration'):
         """
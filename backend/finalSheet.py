@@ -1,7 +1,78 @@
 # backend/finalSheet.py
-from backend.db import get_connection, close_connection
-from backend.commonBackend import validate_group_id
-from typing import List, Dict, Optional
+import json
+import time
+from functools import lru_cache
+from backend.db import get_connection, close_connection, call_procedure
+from backend.commonBackend import (
+    validate_group_id, get_group_data_version, bump_group_data_version, review_totals_query
+)
+from typing import List, Dict, Optional, Tuple
+
+# Cached summaries are dropped when the group's data version changes (writes made by
+# this process) and at the latest after SUMMARY_CACHE_TTL seconds (anything else)
+SUMMARY_CACHE_TTL = 30
+
+
+# Queries behind the final summary, in result-set order. sp_final_summary (installed
+# by final_Preview_Schema.sql) runs the same statements with its gid parameter in
+# place of %s; bump FINAL_SUMMARY_PROCEDURE_VERSION and the procedure's COMMENT
+# together whenever these change.
+FINAL_SUMMARY_PROCEDURE_VERSION = 'v1'
+FINAL_SUMMARY_QUERIES = (
+    # 1. Project information with its panel assignment (reviewer names)
+    """
+        SELECT 
+            p.group_id,
+            p.project_title,
+            p.guide_name,
+            p.mentor_name,
+            p.division,
+            p.project_domain,
+            p.evaluator1_name,
+            p.evaluator2_name,
+            pa.group_id AS panel_group_id,
+            pa.reviewer1,
+            pa.reviewer2,
+            pa.guide
+        FROM projects p
+        LEFT JOIN panel_assignments pa ON pa.group_id = p.group_id
+        WHERE p.group_id = %s
+    """,
+    # 2. All members
+    """
+        SELECT 
+            roll_no,
+            student_name,
+            review1_attendance,
+            review2_attendance,
+            review3_attendance,
+            review4_attendance
+        FROM members
+        WHERE group_id = %s
+        ORDER BY roll_no
+    """,
+    # 3. Marks for all reviews, one row per review with a roll_no -> total JSON object
+    review_totals_query(range(1, 5)),
+)
+
+def fetch_final_summary_results(conn, group_id: str) -> List[Tuple[Tuple[str, ...], List[tuple]]]:
+    """
+    Run the final summary queries for a group, in one round-trip when the
+    stored procedure is available. Returns (column_names, rows) per query,
+    with rows as plain tuples.
+    """
+    results = call_procedure(conn, 'sp_final_summary', FINAL_SUMMARY_PROCEDURE_VERSION, (group_id,))
+    if results is not None:
+        return results
+    
+    # Without the procedure, run the queries as server-side prepared statements
+    # so MySQL parses each once and parameters travel over the binary protocol
+    cursor = conn.cursor(prepared=True)
+    results = []
+    for query in FINAL_SUMMARY_QUERIES:
+        cursor.execute(query, (group_id,) * query.count('%s'))
+        results.append((cursor.column_names, cursor.fetchall()))
+    return results
 
 
 def get_final_summary_data(group_id: str) -> Optional[Dict]:
@@ -27,84 +98,41 @@ def get_final_summary_data(group_id: str) -> Optional[Dict]:
         return None
     
     try:
-        cursor = conn.cursor(dictionary=True)
+        project_result, member_result, (_, marks_rows) = fetch_final_summary_results(conn, group_id)
         
-        # 1. Get project information
-        cursor.execute("""
-            SELECT 
-                p.group_id,
-                p.project_title,
-                p.guide_name,
-                p.mentor_name,
-                p.division,
-                p.project_domain,
-                p.evaluator1_name,
-                p.evaluator2_name
-            FROM projects p
-            WHERE p.group_id = %s
-        """, (group_id,))
-        
-        group_info = cursor.fetchone()
+        # 1. Project information
+        project_columns, project_rows = project_result
+        group_info = dict(zip(project_columns, project_rows[0])) if project_rows else None
         
         if not group_info:
             print(f"No project found for group_id: {group_id}")
             return None
         
-        # 2. Get all members
-        cursor.execute("""
-            SELECT 
-                roll_no,
-                student_name,
-                review1_attendance,
-                review2_attendance,
-                review3_attendance,
-                review4_attendance
-            FROM members
-            WHERE group_id = %s
-            ORDER BY roll_no
-        """, (group_id,))
-        
-        members = cursor.fetchall()
+        # 2. All members (dicts, since they are returned as JSON by the API)
+        member_columns, member_rows = member_result
+        members = [dict(zip(member_columns, row)) for row in member_rows]
         
         if not members:
             print(f"No members found for group_id: {group_id}")
             return None
         
-        # 3. Get marks for all reviews
-        review_marks = {}
-        
-        for review_num in range(1, 5):
-            table_name = f"review{review_num}_marks"
-            
-            cursor.execute(f"""
-                SELECT 
-                    roll_no,
-                    total
-                FROM {table_name}
-                WHERE group_id = %s
-                ORDER BY roll_no
-            """, (group_id,))
-            
-            marks_data = cursor.fetchall()
-            
-            # Convert to dict for easy lookup
-            marks_dict = {row['roll_no']: row['total'] for row in marks_data}
-            review_marks[f'review{review_num}'] = marks_dict
-        
-        # 4. Get panel assignments for reviewer names
-        cursor.execute("""
-            SELECT reviewer1, reviewer2, guide 
-            FROM panel_assignments 
-            WHERE group_id = %s
-        """, (group_id,))
-        panel_data = cursor.fetchone()
+        # 3. Marks arrive as one roll_no -> total JSON object per review
+        review_marks = {f'review{review_num}': {} for review_num in range(1, 5)}
+        for review_num, marks in marks_rows:
+            review_marks[f'review{review_num}'] = json.loads(marks or '{}')
+        
+        # 4. Panel assignment columns joined onto the project row
+        has_panel = group_info.pop('panel_group_id') is not None
+        reviewer1 = group_info.pop('reviewer1')
+        reviewer2 = group_info.pop('reviewer2')
+        panel_guide = group_info.pop('guide')
 
-        if panel_data:
-            group_info['reviewer1_name'] = panel_data.get('reviewer1')
-            group_info['reviewer2_name'] = panel_data.get('reviewer2')
+        if has_panel:
+            group_info['reviewer1_name'] = reviewer1
+            group_info['reviewer2_name'] = reviewer2
             # Override guide name if available in panel_assignments
-            if panel_data.get('guide'):
-                group_info['guide_name'] = panel_data.get('guide')
+            if panel_guide:
+                group_info['guide_name'] = panel_guide
         
         # 5. Build final result
         result = {
@@ -188,6 +216,7 @@ def save_overall_comments(group_id: str, comments: str) -> bool:
         
         cursor.execute(query, (group_id, safe_comments))
         conn.commit()
+        bump_group_data_version(group_id)
         
         print(f"Overall comments saved for group: {group_id}")
         return True
@@ -200,4 +229,47 @@ def save_overall_comments(group_id: str, comments: str) -> bool:
         return False
     
     finally:
-        close_connection(conn)
\ No newline at end of file
+        close_connection(conn)
+
+
+def flatten_review_marks(review_marks: Dict[str, Dict]) -> Dict[Tuple[int, str], float]:
+    """{'reviewN': {roll_no: marks}} -> {(N, roll_no): marks}"""
+    return {
+        (int(key[len('review'):]), roll_no): marks
+        for key, rolls in review_marks.items()
+        for roll_no, marks in rolls.items()
+    }
+
+
+class SummaryUnavailable(Exception):
+    """Raised inside the summary cache so a failed fetch is not cached"""
+
+
+@lru_cache(maxsize=256)
+def _cached_summary(group_id: str, version: int, ttl_bucket: int) -> Dict:
+    """Summary data for one (group, data version, TTL window)"""
+    summary = get_final_summary_data(group_id)
+    if not summary:
+        # Missing data or a DB error; either way the next call should try again
+        raise SummaryUnavailable(group_id)
+    
+    # Flat marks lookup for the PDF; tuple keys aren't JSON-serializable,
+    # so only the cached copy carries it, not the API response
+    return {**summary, 'flat_marks': flatten_review_marks(summary['review_marks'])}
+
+
+def get_cached_final_summary(group_id: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    (summary data, overall comments) for a group, reusing the last summary fetch until
+    the group's data is written or SUMMARY_CACHE_TTL passes. Failed fetches are not
+    cached, and the comments are read fresh each time (get_overall_comments returns
+    None on errors, which must not stick). Callers must not modify the returned
+    data, since it is shared.
+    """
+    ttl_bucket = int(time.monotonic() // SUMMARY_CACHE_TTL)
+    try:
+        summary = _cached_summary(group_id, get_group_data_version(group_id), ttl_bucket)
+    except SummaryUnavailable:
+        return None, None
+    return summary, get_overall_comments(group_id)
+
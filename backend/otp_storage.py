@@ -2,46 +2,67 @@
 """
 File-based OTP storage system for local development and college servers.
 No external dependencies required - completely self-contained.
+OTPs live in a small SQLite database (WAL mode) so each operation touches one row.
 """
 
-import json
-import os
+import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-import random
+import secrets
 import string
 
+# Minimum time between expired-OTP sweeps triggered by store_otp
+SWEEP_INTERVAL_SECONDS = 60
+
 class OTPStorage:
-    """Manages OTP storage in local JSON files"""
+    """Manages OTP storage in a local SQLite file"""
     
     def __init__(self, storage_dir='backend/otp_storage'):
         """Initialize OTP storage directory"""
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self.otp_file = self.storage_dir / 'otps.json'
+        self.otp_file = self.storage_dir / 'otps.sqlite3'
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self._conn = sqlite3.connect(str(self.otp_file), isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
         self._ensure_storage_file()
     
     def _ensure_storage_file(self):
-        """Create storage file if it doesn't exist"""
-        if not self.otp_file.exists():
-            self._write_otps({})
-    
-    def _read_otps(self):
-        """Read all OTPs from storage"""
-        try:
-            with open(self.otp_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+        """Create the OTP table if it doesn't exist"""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS otps (
+                    key TEXT PRIMARY KEY,
+                    otp TEXT NOT NULL,
+                    purpose TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    verified INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_otps_expires ON otps (expires_at)")
     
-    def _write_otps(self, otps):
-        """Write OTPs to storage"""
-        with open(self.otp_file, 'w') as f:
-            json.dump(otps, f, indent=2, default=str)
+    @staticmethod
+    def _row_to_dict(row):
+        """Convert a stored row to the OTP info dict returned by this class"""
+        return {
+            'otp': row['otp'],
+            'purpose': row['purpose'],
+            'created_at': row['created_at'],
+            'expires_at': row['expires_at'],
+            'attempts': row['attempts'],
+            'verified': bool(row['verified'])
+        }
     
     def generate_otp(self, length=6):
-        """Generate a random OTP"""
-        return ''.join(random.choices(string.digits, k=length))
+        """Generate a random OTP using a cryptographically secure source"""
+        return ''.join(secrets.choice(string.digits) for _ in range(length))
     
     def store_otp(self, email, otp, purpose='registration', expiry_minutes=10):
         """
@@ -56,10 +77,9 @@ class OTPStorage:
         Returns:
             dict: OTP information
         """
-        otps = self._read_otps()
-        
-        # Clean expired OTPs first
-        self._clean_expired_otps()
+        # Sweep expired OTPs at most once a minute; lookups check expiry themselves
+        if time.monotonic() - self._last_sweep > SWEEP_INTERVAL_SECONDS:
+            self._clean_expired_otps()
         
         expires_at = datetime.now() + timedelta(minutes=expiry_minutes)
         
@@ -74,9 +94,12 @@ class OTPStorage:
         
         # Store with email as key
         key = f"{email}_{purpose}"
-        otps[key] = otp_data
-        
-        self._write_otps(otps)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO otps (key, otp, purpose, created_at, expires_at, attempts, verified) "
+                "VALUES (?, ?, ?, ?, ?, 0, 0)",
+                (key, otp, purpose, otp_data['created_at'], otp_data['expires_at'])
+            )
         
         return otp_data
     
@@ -92,41 +115,36 @@ class OTPStorage:
         Returns:
             tuple: (success: bool, message: str)
         """
-        otps = self._read_otps()
         key = f"{email}_{purpose}"
         
-        if key not in otps:
-            return False, "No OTP found for this email"
-        
-        otp_data = otps[key]
-        
-        # Check if already verified
-        if otp_data.get('verified'):
-            return False, "OTP already used"
-        
-        # Check expiration
-        expires_at = datetime.fromisoformat(otp_data['expires_at'])
-        if datetime.now() > expires_at:
-            del otps[key]
-            self._write_otps(otps)
-            return False, "OTP has expired"
-        
-        # Check attempts
-        if otp_data['attempts'] >= 3:
-            return False, "Too many failed attempts"
-        
-        # Verify OTP
-        if otp_data['otp'] == otp:
-            otp_data['verified'] = True
-            otps[key] = otp_data
-            self._write_otps(otps)
-            return True, "OTP verified successfully"
-        else:
-            otp_data['attempts'] += 1
-            otps[key] = otp_data
-            self._write_otps(otps)
-            remaining = 3 - otp_data['attempts']
-            return False, f"Invalid OTP. {remaining} attempts remaining"
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM otps WHERE key = ?", (key,)).fetchone()
+            
+            if row is None:
+                return False, "No OTP found for this email"
+            
+            # Check if already verified
+            if row['verified']:
+                return False, "OTP already used"
+            
+            # Check expiration
+            expires_at = datetime.fromisoformat(row['expires_at'])
+            if datetime.now() > expires_at:
+                self._conn.execute("DELETE FROM otps WHERE key = ?", (key,))
+                return False, "OTP has expired"
+            
+            # Check attempts
+            if row['attempts'] >= 3:
+                return False, "Too many failed attempts"
+            
+            # Verify OTP
+            if row['otp'] == otp:
+                self._conn.execute("UPDATE otps SET verified = 1 WHERE key = ?", (key,))
+                return True, "OTP verified successfully"
+            else:
+                self._conn.execute("UPDATE otps SET attempts = attempts + 1 WHERE key = ?", (key,))
+                remaining = 3 - (row['attempts'] + 1)
+                return False, f"Invalid OTP. {remaining} attempts remaining"
     
     def get_otp(self, email, purpose='registration'):
         """
@@ -139,49 +157,41 @@ class OTPStorage:
         Returns:
             str or None: The OTP if exists and valid
         """
-        otps = self._read_otps()
         key = f"{email}_{purpose}"
         
-        if key not in otps:
-            return None
+        with self._lock:
+            row = self._conn.execute("SELECT otp, expires_at FROM otps WHERE key = ?", (key,)).fetchone()
         
-        otp_data = otps[key]
+        if row is None:
+            return None
         
         # Check expiration
-        expires_at = datetime.fromisoformat(otp_data['expires_at'])
+        expires_at = datetime.fromisoformat(row['expires_at'])
         if datetime.now() > expires_at:
             return None
         
-        return otp_data['otp']
+        return row['otp']
     
     def delete_otp(self, email, purpose='registration'):
         """Delete OTP after successful use"""
-        otps = self._read_otps()
         key = f"{email}_{purpose}"
-        
-        if key in otps:
-            del otps[key]
-            self._write_otps(otps)
+        with self._lock:
+            self._conn.execute("DELETE FROM otps WHERE key = ?", (key,))
     
     def _clean_expired_otps(self):
         """Remove expired OTPs from storage"""
-        otps = self._read_otps()
-        now = datetime.now()
-        
-        # Filter out expired OTPs
-        valid_otps = {
-            key: data for key, data in otps.items()
-            if datetime.fromisoformat(data['expires_at']) > now
-        }
-        
-        if len(valid_otps) != len(otps):
-            self._write_otps(valid_otps)
+        # ISO timestamps from datetime.isoformat() sort chronologically as text
+        with self._lock:
+            self._conn.execute("DELETE FROM otps WHERE expires_at <= ?", (datetime.now().isoformat(),))
+            self._last_sweep = time.monotonic()
     
     def get_all_otps(self):
         """Get all active OTPs (for debugging)"""
         self._clean_expired_otps()
-        return self._read_otps()
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM otps").fetchall()
+        return {row['key']: self._row_to_dict(row) for row in rows}
 
 
 # Global instance
-otp_storage = OTPStorage()
\ No newline at end of file
+otp_storage = OTPStorage()
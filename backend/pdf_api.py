@@ -1,21 +1,113 @@
 # backend/pdf_api.py
-from flask import Blueprint, request, jsonify, make_response
+from flask import Blueprint, request, jsonify, send_file
+import io
 import os
-import tempfile
+import queue
+import threading
+import time
 import traceback
-from datetime import datetime
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from backend.commonBackend import (
     get_available_pdf_reports,
     check_pdf_data_availability,
-    log_pdf_generation,
+    check_pdf_data_availability_bulk,
+    log_pdf_generations,
     validate_review_number,
     validate_group_id
 )
-from backend.pdf_generator import generate_review_pdf
 
 pdf_bp = Blueprint("pdf_api", __name__, url_prefix="/pdf")
 
+# Shared worker pool for PDF rendering and availability checks; bounded so
+# concurrent requests can't exhaust the DB connection pool
+PDF_WORKERS = int(os.getenv('PDF_WORKERS', 8))
+pdf_executor = ThreadPoolExecutor(max_workers=PDF_WORKERS, thread_name_prefix='pdf')
+
+# PDF generation logs are written in batches by a background thread so requests
+# don't wait on the extra DB round-trip; local requests (development, health
+# checks) aren't logged. The queue is bounded and drops the oldest entries.
+LOCAL_ADDRESSES = ('127.0.0.1', '::1')
+LOG_BATCH_SIZE = 100
+LOG_BATCH_WINDOW = 0.5
+_generation_log_queue = queue.Queue(maxsize=1000)
+
+
+def _drain_generation_logs():
+    """Write queued generation log entries in batches until the process exits"""
+    while True:
+        batch = [_generation_log_queue.get()]
+        deadline = time.monotonic() + LOG_BATCH_WINDOW
+        while len(batch) < LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_generation_log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        try:
+            log_pdf_generations(batch)
+        except Exception as log_error:
+            print(f"Warning: Failed to log PDF generations: {log_error}")
+
+
+threading.Thread(target=_drain_generation_logs, name='pdf-log-writer', daemon=True).start()
+
+
+def queue_generation_log(review_number, group_id):
+    """Queue a generation log entry for the current request"""
+    remote_addr = request.remote_addr
+    if remote_addr in LOCAL_ADDRESSES:
+        return
+    
+    entry = (review_number, group_id, remote_addr, remote_addr, request.headers.get('User-Agent', ''))
+    while True:
+        try:
+            _generation_log_queue.put_nowait(entry)
+            return
+        except queue.Full:
+            # Drop the oldest entry to make room under a log flood
+            try:
+                _generation_log_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+
+# Short-lived cache for listing/statistics data that changes on the order of minutes
+RESPONSE_CACHE_TTL = 30
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
+
+def get_cached(key, loader, ttl=RESPONSE_CACHE_TTL):
+    """
+    Return (value, filled_at) for key, calling loader() when the cached value
+    is missing or older than ttl seconds. None results are not cached.
+    """
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+    if entry and time.time() - entry[1] < ttl:
+        return entry
+    
+    entry = (loader(), time.time())
+    if entry[0] is not None:
+        with _response_cache_lock:
+            _response_cache[key] = entry
+    return entry
+
+
+def conditional_json(payload, key, filled_at):
+    """JSON response with ETag/Last-Modified from the cache fill time, answering 304 when unchanged"""
+    response = jsonify(payload)
+    response.set_etag(f"{key}-{int(filled_at * 1000)}")
+    response.last_modified = datetime.fromtimestamp(filled_at, timezone.utc)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 
 @pdf_bp.route('/health', methods=['GET'])
 def pdf_health_check():
@@ -34,19 +126,14 @@ def get_available_pdfs():
     This doesn't generate PDFs, just returns what can be generated
     """
     try:
-        reports = get_available_pdf_reports()
+        reports, filled_at = get_cached('available-pdfs', load_available_pdfs)
         
-        # Add additional metadata
-        for report in reports:
-            report['can_generate'] = True
-            report['pdf_url'] = f"/pdf/generate/{report['review_number']}/{report['group_id']}"
-        
-        return jsonify({
+        return conditional_json({
             'success': True,
             'reports': reports,
             'count': len(reports),
-            'timestamp': datetime.now().isoformat()
-        }), 200
+            'timestamp': datetime.fromtimestamp(filled_at).isoformat()
+        }, 'available-pdfs', filled_at)
         
     except Exception as e:
         print(f"Error in get_available_pdfs: {e}")
@@ -58,6 +145,18 @@ def get_available_pdfs():
         }), 500
 
 
+def load_available_pdfs():
+    """Fetch available reports and add the metadata the listing endpoint exposes"""
+    reports = get_available_pdf_reports()
+    
+    # Add additional metadata
+    for report in reports:
+        report['can_generate'] = True
+        report['pdf_url'] = f"/pdf/generate/{report['review_number']}/{report['group_id']}"
+    
+    return reports
+
+
 @pdf_bp.route('/check-availability/<int:review_number>/<group_id>', methods=['GET'])
 def check_pdf_availability(review_number, group_id):
     """
@@ -88,14 +187,11 @@ def check_pdf_availability(review_number, group_id):
         }), 500
 
 
-@pdf_bp.route('/generate/<int:review_number>/<group_id>', methods=['GET'])
-def generate_pdf_on_demand(review_number, group_id):
+def generate_and_respond(review_number, group_id, attachment):
     """
-    Generate PDF on-demand and return as binary stream
-    Does NOT save to server permanently
+    Shared body of the generate/download endpoints: validate, check availability,
+    render into memory and send the PDF (inline or as an attachment)
     """
-    temp_path = None
-    
     try:
         # Validate inputs
         if not validate_review_number(review_number):
@@ -110,7 +206,12 @@ def generate_pdf_on_demand(review_number, group_id):
                 'error': 'Invalid group ID format'
             }), 400
         
-        # Check if data is available
+        print(f"Generating PDF{' for download' if attachment else ''}: Review {review_number}, Group {group_id}")
+        
+        # Imported on first use: ReportLab, NumPy and PIL are only loaded by workers that render PDFs
+        from backend.pdf_generator import generate_review_pdf
+        
+        # Check data availability first so a missing group never costs a render
         availability = check_pdf_data_availability(review_number, group_id)
         if not availability.get('available'):
             return jsonify({
@@ -118,163 +219,211 @@ def generate_pdf_on_demand(review_number, group_id):
                 'error': availability.get('error', 'Required data not available')
             }), 404
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', prefix='review_') as tmp_file:
-            temp_path = tmp_file.name
-        
-        print(f"Generating PDF: Review {review_number}, Group {group_id} -> {temp_path}")
-        
-        # Generate PDF
-        result = generate_review_pdf(review_number, group_id, temp_path)
+        # Render the PDF into memory on the bounded worker pool
+        pdf_buffer = io.BytesIO()
+        result = pdf_executor.submit(generate_review_pdf, review_number, group_id, pdf_buffer).result()
         
         if not result['success']:
-            if temp_path and os.path.exists(temp_path):
-                os.remove(temp_path)
             return jsonify({
                 'success': False,
                 'error': result.get('error', 'PDF generation failed')
             }), 500
         
-        # Read PDF into memory
-        with open(temp_path, 'rb') as f:
-            pdf_data = f.read()
-        
-        # Clean up temporary file immediately
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-            print(f"Cleaned up temp file: {temp_path}")
-        
-        # Optional: Log generation
-        try:
-            log_pdf_generation(
-                review_number, 
-                group_id,
-                generated_by=request.remote_addr,
-                ip_address=request.remote_addr,
-                user_agent=request.headers.get('User-Agent', '')[:500]
-            )
-        except Exception as log_error:
-            print(f"Warning: Failed to log PDF generation: {log_error}")
-            # Don't fail the request if logging fails
-        
-        # Create response with PDF
-        response = make_response(pdf_data)
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'inline; filename=Review_{review_number}_{group_id}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
-        response.headers['Content-Length'] = len(pdf_data)
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
-        
-        print(f"Successfully generated and sent PDF: {len(pdf_data)} bytes")
+        pdf_buffer.seek(0)
+        
+        # Optional: Log generation (written in the background, never fails the request)
+        queue_generation_log(review_number, group_id)
+        
+        # Send the rendered PDF straight from the buffer
+        response = send_file(
+            pdf_buffer,
+            mimetype='application/pdf',
+            as_attachment=attachment,
+            download_name=f'Review_{review_number}_{group_id}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf',
+            conditional=True
+        )
+        if not attachment:
+            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+            response.headers['Pragma'] = 'no-cache'
+            response.headers['Expires'] = '0'
+        
+        print(f"Successfully generated and sent PDF: {response.content_length} bytes")
         return response
         
     except Exception as e:
-        print(f"Error generating PDF: {e}")
+        print(f"Error {'downloading' if attachment else 'generating'} PDF: {e}")
         traceback.print_exc()
         
-        # Clean up temp file if it exists
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except:
-                pass
-        
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+@pdf_bp.route('/generate/<int:review_number>/<group_id>', methods=['GET'])
+def generate_pdf_on_demand(review_number, group_id):
+    """
+    Generate PDF on-demand and return as binary stream
+    Does NOT save to server permanently
+    """
+    return generate_and_respond(review_number, group_id, attachment=False)
+
+
 @pdf_bp.route('/download/<int:review_number>/<group_id>', methods=['GET'])
 def download_pdf_on_demand(review_number, group_id):
     """
     Generate PDF and force download (same as generate but with attachment disposition)
     """
-    temp_path = None
+    return generate_and_respond(review_number, group_id, attachment=True)
+
+
+# Background PDF jobs: the request returns a job id at once and the client polls
+# /status/<job_id>. A finished job keeps its rendered bytes until it is downloaded
+# or PDF_JOB_TTL seconds pass; at most PDF_MAX_JOBS jobs are held at a time.
+PDF_JOB_TTL = 600
+PDF_MAX_JOBS = int(os.getenv('PDF_MAX_JOBS', 32))
+_pdf_jobs = {}
+_pdf_jobs_lock = threading.Lock()
+
+
+def render_pdf_job(review_number, group_id):
+    """Render one review PDF into memory; returns (result dict, PDF bytes)"""
+    from backend.pdf_generator import generate_review_pdf, generate_review5_pdf
     
-    try:
-        # Validate inputs
-        if not validate_review_number(review_number):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid review number. Must be 1-4.'
-            }), 400
-        
-        if not validate_group_id(group_id):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid group ID format'
-            }), 400
-        
-        # Check if data is available
-        availability = check_pdf_data_availability(review_number, group_id)
-        if not availability.get('available'):
-            return jsonify({
-                'success': False,
-                'error': availability.get('error', 'Required data not available')
-            }), 404
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', prefix='review_') as tmp_file:
-            temp_path = tmp_file.name
-        
-        print(f"Generating PDF for download: Review {review_number}, Group {group_id}")
-        
-        # Generate PDF
-        result = generate_review_pdf(review_number, group_id, temp_path)
-        
-        if not result['success']:
-            if temp_path and os.path.exists(temp_path):
-                os.remove(temp_path)
-            return jsonify({
+    pdf_buffer = io.BytesIO()
+    if review_number == 5:
+        result = generate_review5_pdf(group_id, pdf_buffer)
+    else:
+        result = generate_review_pdf(review_number, group_id, pdf_buffer)
+    return result, pdf_buffer.getvalue()
+
+
+def prune_pdf_jobs():
+    """Forget jobs older than PDF_JOB_TTL (cancelling any that haven't started); caller holds _pdf_jobs_lock"""
+    cutoff = time.monotonic() - PDF_JOB_TTL
+    for job_id in [job_id for job_id, job in _pdf_jobs.items() if job['created_at'] < cutoff]:
+        _pdf_jobs.pop(job_id)['future'].cancel()
+
+
+def get_pdf_job(job_id, remove=False):
+    """Look up a job (pruning expired ones first); remove=True takes it out of the table"""
+    with _pdf_jobs_lock:
+        prune_pdf_jobs()
+        return _pdf_jobs.pop(job_id, None) if remove else _pdf_jobs.get(job_id)
+
+
+@pdf_bp.route('/jobs/<int:review_number>/<group_id>', methods=['POST'])
+def submit_pdf_job(review_number, group_id):
+    """
+    Start generating a PDF in the background
+    Returns a job id to poll at /pdf/status/<job_id>
+    """
+    if not validate_review_number(review_number):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid review number'
+        }), 400
+    
+    if not validate_group_id(group_id):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid group ID format'
+        }), 400
+    
+    job_id = uuid.uuid4().hex
+    with _pdf_jobs_lock:
+        prune_pdf_jobs()
+        if len(_pdf_jobs) >= PDF_MAX_JOBS:
+            response = jsonify({
                 'success': False,
-                'error': result.get('error', 'PDF generation failed')
-            }), 500
-        
-        # Read PDF into memory
-        with open(temp_path, 'rb') as f:
-            pdf_data = f.read()
-        
-        # Clean up temporary file
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-        
-        # Optional: Log generation
-        try:
-            log_pdf_generation(
-                review_number, 
-                group_id,
-                generated_by=request.remote_addr,
-                ip_address=request.remote_addr,
-                user_agent=request.headers.get('User-Agent', '')[:500]
-            )
-        except:
-            pass
-        
-        # Create response with PDF (as attachment for download)
-        response = make_response(pdf_data)
-        response.headers['Content-Type'] = 'application/pdf'
-        response.headers['Content-Disposition'] = f'attachment; filename=Review_{review_number}_{group_id}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
-        response.headers['Content-Length'] = len(pdf_data)
-        
-        return response
-        
+                'error': 'Too many PDF jobs in progress, try again shortly'
+            })
+            response.headers['Retry-After'] = '30'
+            return response, 503
+        
+        _pdf_jobs[job_id] = {
+            'review_number': review_number,
+            'group_id': group_id,
+            'future': pdf_executor.submit(render_pdf_job, review_number, group_id),
+            'created_at': time.monotonic()
+        }
+    
+    print(f"Queued PDF job {job_id}: Review {review_number}, Group {group_id}")
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status_url': f"/pdf/status/{job_id}"
+    }), 202
+
+
+@pdf_bp.route('/status/<job_id>', methods=['GET'])
+def get_pdf_job_status(job_id):
+    """Report whether a background PDF job is pending, done or failed"""
+    job = get_pdf_job(job_id)
+    if not job:
+        return jsonify({
+            'success': False,
+            'error': 'Unknown or expired job'
+        }), 404
+    
+    future = job['future']
+    if not future.done():
+        return jsonify({'success': True, 'status': 'pending'}), 200
+    
+    try:
+        result, _ = future.result()
     except Exception as e:
-        print(f"Error downloading PDF: {e}")
-        traceback.print_exc()
-        
-        # Clean up temp file if it exists
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except:
-                pass
-        
+        result = {'success': False, 'error': str(e)}
+    
+    if not result['success']:
         return jsonify({
             'success': False,
-            'error': str(e)
+            'status': 'failed',
+            'error': result.get('error', 'PDF generation failed')
+        }), 200
+    
+    return jsonify({
+        'success': True,
+        'status': 'done',
+        'download_url': f"/pdf/jobs/{job_id}/download"
+    }), 200
+
+
+@pdf_bp.route('/jobs/<job_id>/download', methods=['GET'])
+def download_pdf_job(job_id):
+    """Send the PDF rendered by a finished background job (once; the job is then forgotten)"""
+    job = get_pdf_job(job_id)
+    if not job or not job['future'].done():
+        return jsonify({
+            'success': False,
+            'error': 'PDF not ready'
+        }), 404
+    
+    # Drop the job and its bytes; a concurrent download of the same job gets 404
+    if not get_pdf_job(job_id, remove=True):
+        return jsonify({
+            'success': False,
+            'error': 'PDF not ready'
+        }), 404
+    
+    try:
+        result, pdf_bytes = job['future'].result()
+    except Exception as e:
+        result, pdf_bytes = {'success': False, 'error': str(e)}, b''
+    
+    if not result['success']:
+        return jsonify({
+            'success': False,
+            'error': result.get('error', 'PDF generation failed')
         }), 500
+    
+    queue_generation_log(job['review_number'], job['group_id'])
+    return send_file(
+        io.BytesIO(pdf_bytes),
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name=f"Review_{job['review_number']}_{job['group_id']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    )
 
 
 @pdf_bp.route('/batch-generate', methods=['POST'])
@@ -293,6 +442,14 @@ def batch_generate_pdfs():
                 'error': 'No PDF requests provided'
             }), 400
         
+        # Check availability for all valid requests with a handful of set-based queries
+        valid_pairs = [
+            (req.get('review_number'), req.get('group_id'))
+            for req in requests_list
+            if validate_review_number(req.get('review_number')) and validate_group_id(req.get('group_id'))
+        ]
+        availability_by_pair = check_pdf_data_availability_bulk(valid_pairs)
+        
         results = []
         
         for req in requests_list:
@@ -308,7 +465,7 @@ def batch_generate_pdfs():
                 })
                 continue
             
-            availability = check_pdf_data_availability(review_number, group_id)
+            availability = availability_by_pair[(review_number, group_id)]
             if availability.get('available'):
                 results.append({
                     'review_number': review_number,
@@ -346,15 +503,37 @@ def get_pdf_statistics():
     Get statistics about PDF generation
     """
     try:
-        from backend.db import get_connection, close_connection
+        stats, filled_at = get_cached('statistics', load_pdf_statistics)
         
-        conn = get_connection()
-        if not conn:
+        if stats is None:
             return jsonify({
                 'success': False,
                 'error': 'Database connection failed'
             }), 500
         
+        return conditional_json({
+            'success': True,
+            'statistics': stats
+        }, 'statistics', filled_at)
+        
+    except Exception as e:
+        print(f"Error getting PDF statistics: {e}")
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+def load_pdf_statistics():
+    """Collect PDF statistics from the database; returns None if it can't connect"""
+    from backend.db import get_connection, close_connection
+    
+    conn = get_connection()
+    if not conn:
+        return None
+    
+    try:
         cursor = conn.cursor(dictionary=True)
         
         stats = {
@@ -367,10 +546,13 @@ def get_pdf_statistics():
         cursor.execute("SELECT COUNT(DISTINCT group_id) as count FROM projects")
         stats['total_groups'] = cursor.fetchone()['count']
         
-        # Count reviews by type
-        for review_num in range(1, 5):
-            cursor.execute(f"SELECT COUNT(*) as count FROM review{review_num}_group_responses")
-            stats['reviews_by_type'][f'review_{review_num}'] = cursor.fetchone()['count']
+        # Count reviews by type in one round-trip
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT {review_num} AS review_num, COUNT(*) AS count FROM review{review_num}_group_responses"
+            for review_num in range(1, 5)
+        ))
+        for row in cursor.fetchall():
+            stats['reviews_by_type'][f"review_{row['review_num']}"] = row['count']
         
         # Get recent generations (if logging table exists)
         try:
@@ -388,17 +570,7 @@ def get_pdf_statistics():
         except:
             stats['recent_generations'] = []
         
+        return stats
+    
+    finally:
         close_connection(conn)
-        
-        return jsonify({
-            'success': True,
-            'statistics': stats
-        }), 200
-        
-    except Exception as e:
-        print(f"Error getting PDF statistics: {e}")
-        traceback.print_exc()
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
\ No newline at end of file
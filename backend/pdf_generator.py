@@ -1,35 +1,163 @@
 # backend/pdf_generator.py
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+from reportlab.platypus import (SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak,
+                                ListFlowable, ListItem, LongTable)
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.utils import simpleSplit
+from reportlab.lib.fonts import ps2tt, tt2ps
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+import copy
+import hashlib
+import io
 import os
-from backend.db import get_connection, close_connection
+import threading
+import time
+from types import MappingProxyType
+from PIL import Image as PILImage
+from backend.db import get_connection, close_connection, call_procedure
+from backend.commonBackend import validate_review_number
 
 # Roman numeral mapping for review numbers
 REVIEW_ROMAN = {1: 'I', 2: 'II', 3: 'III', 4: 'IV', 0: 'Mock', 5: 'V'}
 
+# Compress page content streams in every PDF this process renders
+rl_config.pageCompression = 1
+
+# Institute logo shown in every page header
+LOGO_PIXELS = 240
+LOGO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         'frontend', 'static', 'images', 'logo.png')
+
+# Rendered review PDFs keyed by (review_number, group_id, data fingerprint)
+PDF_CACHE_SIZE = int(os.getenv('PDF_CACHE_SIZE', 128))
+_pdf_cache = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+# (review_number, group_id) -> [lock, holders]; entries go once no request holds or waits
+_pdf_render_locks = {}
+
+# Parsed Paragraphs kept for text repeated across PDFs (see shared_paragraph)
+SHARED_PARAGRAPH_CACHE_SIZE = 2048
+
 class GenericReviewPDFGenerator:
+    # Table styles that never depend on the data; TableStyle is only read by setStyle,
+    # so one instance is shared by every table
+    _HEADER_STYLE = TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('ALIGN', (1, 0), (1, 0), 'CENTER'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ])
+    
+    _PROJECT_INFO_STYLE = TableStyle([
+        ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
+        ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 9),
+        ('FONT', (2, 0), (2, 0), 'Helvetica-Bold', 9),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('SPAN', (1, 1), (3, 1)),
+        ('LEFTPADDING', (0, 0), (-1, -1), 5),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ])
+    
+    _SIGNATURE_STYLE = TableStyle([
+        ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ])
+    
+    # Fixed commands for tables whose spans depend on row/member counts;
+    # each table copies these and appends its own
+    _MEMBERS_STATIC_STYLE = (
+        ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 9),
+        ('FONT', (0, 1), (3, -1), 'Helvetica', 9),
+        ('VALIGN', (0, 0), (3, -1), 'MIDDLE'),
+        ('VALIGN', (4, 1), (4, -1), 'TOP'),
+        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('LEFTPADDING', (0, 0), (-1, -1), 3),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+        ('TOPPADDING', (0, 0), (-1, -1), 3),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    )
+    
+    _CHECKLIST_SECTION_COLOR = colors.HexColor("#7A7979")
+    _CHECKLIST_STATIC_STYLE = (
+        ('BACKGROUND', (0, 0), (1, 0), colors.HexColor("#272727")),
+        ('FONT', (0, 0), (1, 0), 'Helvetica-Bold', 10),
+        ('TEXTCOLOR', (0, 0), (1, 0), colors.white),
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ('LEFTPADDING', (0, 0), (1, 0), 6),
+        ('RIGHTPADDING', (0, 0), (1, 0), 6),
+        ('TOPPADDING', (0, 0), (1, 0), 6),
+        ('BOTTOMPADDING', (0, 0), (1, 0), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONT', (0, 1), (0, -1), 'Helvetica', 9),
+        ('FONT', (1, 1), (1, -1), 'Helvetica-Bold', 9),
+        ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+        ('LEFTPADDING', (0, 1), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 1), (-1, -1), 6),
+        ('TOPPADDING', (0, 1), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
+    )
+    
+    _PERFORMANCE_STATIC_STYLE = (
+        ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ALIGN', (2, 4), (-1, -1), 'CENTER'),
+        ('ALIGN', (0, 0), (-1, 3), 'CENTER'),
+        ('ALIGN', (0, 4), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 4), (1, -1), 'CENTER'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('LEFTPADDING', (0, 0), (-1, -1), 4),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+        ('TOPPADDING', (0, 0), (-1, -1), 3),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        ('SPAN', (0, 3), (1, 3)),
+        ('SPAN', (0, 1), (1, 2)),
+        # Totals are plain strings; bold them through the table style
+        ('FONT', (2, -1), (-1, -1), 'Helvetica-Bold', 9),
+    )
+    
     def __init__(self, output_path, review_number):
         self.output_path = output_path
         self.review_number = review_number
         self.review_roman = REVIEW_ROMAN.get(review_number, str(review_number))
         
-        self.doc = SimpleDocTemplate(output_path, pagesize=A4,
+        # Render into memory; build() writes a path target in a single write
+        self._buffer = io.BytesIO() if isinstance(output_path, str) else output_path
+        self.doc = SimpleDocTemplate(self._buffer, pagesize=A4, pageCompression=1,
                                      rightMargin=0.5*inch, leftMargin=0.5*inch,
                                      topMargin=0.5*inch, bottomMargin=0.5*inch)
         self.elements = []
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = STYLES
     
-    def _setup_custom_styles(self):
-        """Create custom paragraph styles"""
-        self.styles.add(ParagraphStyle(
+    @staticmethod
+    def build_stylesheet():
+        """
+        Sample stylesheet plus the custom paragraph styles. Built once per process
+        (STYLES): the styles are only read while documents are built.
+        """
+        styles = getSampleStyleSheet()
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=11,
             textColor=colors.black,
             spaceAfter=2,
@@ -39,9 +167,9 @@ class GenericReviewPDFGenerator:
             leading=13
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomSubtitle',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=11,
             textColor=colors.black,
             spaceAfter=2,
@@ -51,9 +179,9 @@ class GenericReviewPDFGenerator:
             leading=13
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomSubtitle2',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=10,
             textColor=colors.black,
             spaceAfter=0,
@@ -63,9 +191,9 @@ class GenericReviewPDFGenerator:
             leading=12
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=10,
             textColor=colors.black,
             spaceAfter=8,
@@ -75,9 +203,9 @@ class GenericReviewPDFGenerator:
             leftIndent=70
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='QuestionText',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=8.5,
             leading=10,
             fontName='Helvetica',
@@ -86,28 +214,137 @@ class GenericReviewPDFGenerator:
             rightIndent=0
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomNormal',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=9,
             leading=11,
             fontName='Helvetica',
             leftIndent=20,
         ))
         
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CenteredNormal',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             alignment=TA_CENTER
         ))
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='TableTextSmall',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=8.5,
             leading=9,
             fontName='Helvetica',
             alignment=TA_LEFT
         ))
+        
+        # Checklist table cells
+        styles.add(ParagraphStyle(
+            name='ChecklistHeaderLeft',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.white,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER
+        ))
+        styles.add(ParagraphStyle(
+            name='ChecklistHeaderRight',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.white,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER
+        ))
+        styles.add(ParagraphStyle(
+            name='ChecklistSection',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.white,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER
+        ))
+        styles.add(ParagraphStyle(
+            name='ChecklistQuestion',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Helvetica',
+            alignment=TA_LEFT,
+            leading=11
+        ))
+        
+        # Performance table cells
+        styles.add(ParagraphStyle(
+            name='PerfHeaderBold',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Helvetica-Bold',
+            alignment=TA_LEFT
+        ))
+        styles.add(ParagraphStyle(
+            name='PerfColNum',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Helvetica-Bold',
+            alignment=TA_CENTER
+        ))
+        styles.add(ParagraphStyle(
+            name='PerfCriteria',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Helvetica',
+            alignment=TA_LEFT
+        ))
+        styles.add(ParagraphStyle(
+            name='PerfMarksLabel',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Helvetica',
+            alignment=TA_CENTER
+        ))
+        styles.add(ParagraphStyle(
+            name='PerfTotalBold',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Helvetica-Bold',
+            alignment=TA_LEFT
+        ))
+        
+        # Comments notes and deliverables
+        styles.add(ParagraphStyle(
+            name='NoteStyle',
+            parent=styles['Normal'],
+            fontSize=8,
+            fontName='Helvetica',
+            alignment=TA_LEFT,
+            leftIndent=20
+        ))
+        styles.add(ParagraphStyle(
+            name='DeliverableTitle',
+            parent=styles['Normal'],
+            fontSize=10,
+            fontName='Helvetica-Bold',
+            textColor=colors.HexColor('#CC0000'),
+            alignment=TA_LEFT,
+            spaceAfter=6,
+            leftIndent=20
+        ))
+        styles.add(ParagraphStyle(
+            name='DeliverableItem',
+            parent=styles['Normal'],
+            fontSize=9,
+            fontName='Helvetica',
+            alignment=TA_LEFT,
+            spaceAfter=0.02*inch
+        ))
+        
+        return styles
+    
+    def _shared_paragraph(self, text, style_name):
+        """
+        Paragraph for text that repeats across PDFs (titles, labels, questions,
+        criteria). The markup is parsed once and kept in an LRU cache; each use gets a shallow
+        copy because a Paragraph keeps its wrap/split state on the instance.
+        """
+        return copy.copy(shared_paragraph(text, style_name))
     
     def calculate_academic_year(self, submission_date):
         """Calculate academic year based on submission date"""
@@ -116,54 +353,34 @@ class GenericReviewPDFGenerator:
         else:
             date_obj = submission_date
         
+        # The academic year starts in July
         year = date_obj.year
-        month = date_obj.month
-        
-        if month < 7:
-            return f"{year-1}-{str(year)[2:]}"
-        else:
-            return f"{year}-{str(year+1)[2:]}"
+        return academic_year_label(year - 1 if date_obj.month < 7 else year)
     
     def add_header(self, academic_year, logo_path=None):
         """Add institute header with logo"""
-        if logo_path is None:
-            # Construct absolute path to the logo
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            logo_path = os.path.join(base_dir, 'frontend', 'static', 'images', 'logo.png')
+        logo_data = load_logo_bytes(logo_path or LOGO_PATH)
 
         logo_img = None
-        try:
-            if os.path.exists(logo_path):
-                logo_img = Image(logo_path, width=0.8*inch, height=0.8*inch)
-            else:
-                print(f"Logo not found at path: {logo_path}")
-        except Exception as e:
-            print(f"Error loading logo: {e}")
-        
-        title1 = Paragraph("<b>Hope Foundation's</b>", self.styles['CustomTitle'])
-        title2 = Paragraph("<b>International Institute of Information Technology, Pune</b>", 
-                          self.styles['CustomTitle'])
-        subtitle1 = Paragraph(f"<b>PROJECT REVIEW – {self.review_roman}</b>", self.styles['CustomSubtitle'])
-        subtitle2 = Paragraph(f"(Academic Year: {academic_year})", self.styles['CustomSubtitle2'])
+        if logo_data:
+            try:
+                logo_img = Image(io.BytesIO(logo_data), width=0.8*inch, height=0.8*inch)
+            except Exception as e:
+                print(f"Error loading logo: {e}")
+        
+        title1 = self._shared_paragraph("<b>Hope Foundation's</b>", 'CustomTitle')
+        title2 = self._shared_paragraph("<b>International Institute of Information Technology, Pune</b>", 
+                                        'CustomTitle')
+        subtitle1 = self._shared_paragraph(f"<b>PROJECT REVIEW – {self.review_roman}</b>", 'CustomSubtitle')
+        subtitle2 = self._shared_paragraph(f"(Academic Year: {academic_year})", 'CustomSubtitle2')
         
         if logo_img:
             header_data = [[logo_img, [title1, title2, subtitle1, subtitle2]]]
             header_table = Table(header_data, colWidths=[1*inch, 5.5*inch])
-            header_table.setStyle(TableStyle([
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ]))
+            header_table.setStyle(self._HEADER_STYLE)
             self.elements.append(header_table)
         else:
-            self.elements.append(title1)
-            self.elements.append(title2)
-            self.elements.append(subtitle1)
-            self.elements.append(subtitle2)
+            self.elements.extend((title1, title2, subtitle1, subtitle2))
         
         self.elements.append(Spacer(1, 0.15*inch))
     
@@ -176,21 +393,9 @@ class GenericReviewPDFGenerator:
         
         col_widths = [1*inch, 2.7*inch, 0.7*inch, 2.1*inch]
         info_table = Table(info_data, colWidths=col_widths)
-        info_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
-            ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 9),
-            ('FONT', (2, 0), (2, 0), 'Helvetica-Bold', 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('SPAN', (1, 1), (3, 1)),
-            ('LEFTPADDING', (0, 0), (-1, -1), 5),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ]))
-        
-        self.elements.append(info_table)
-        self.elements.append(Spacer(1, 0.12*inch))
+        info_table.setStyle(self._PROJECT_INFO_STYLE)
+        
+        self.elements.extend((info_table, Spacer(1, 0.12*inch)))
     
     def add_members_table(self, members, guide_info):
         """Add team members table with guide details"""
@@ -205,20 +410,12 @@ class GenericReviewPDFGenerator:
             'Sr.No.', 
             'Roll No.', 
             'Student Name', 
-            Paragraph('<b>Contact Details</b>', self.styles['TableTextSmall']),
-            Paragraph('<b>Internal / External<br/>Guide Details</b>', self.styles['TableTextSmall'])
+            self._shared_paragraph('<b>Contact Details</b>', 'TableTextSmall'),
+            self._shared_paragraph('<b>Internal / External<br/>Guide Details</b>', 'TableTextSmall')
         ]
         data = [header]
         
-        guide_content_lines = [
-            f"Guide Name : {guide_name}",
-            "",
-            f"Mentor Name: {mentor_name}",
-            "",
-            f"Mentor Mobile No. & Email :",
-            f"{mentor_mobile} {mentor_email}"
-        ]
-        guide_content = '<br/>'.join(guide_content_lines)
+        guide_content = guide_details_markup(guide_name, mentor_name, mentor_mobile, mentor_email)
         guide_para = Paragraph(guide_content, self.styles['TableTextSmall'])
         
         for idx, member in enumerate(members, 1):
@@ -243,209 +440,140 @@ class GenericReviewPDFGenerator:
         col_widths = [0.4*inch, 0.7*inch, 1.8*inch, 1.6*inch, 2*inch]
         members_table = Table(data, colWidths=col_widths)
         
-        style_commands = [
-            ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 9),
-            ('FONT', (0, 1), (3, -1), 'Helvetica', 9),
-            ('VALIGN', (0, 0), (3, -1), 'MIDDLE'),
-            ('VALIGN', (4, 1), (4, -1), 'TOP'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('LEFTPADDING', (0, 0), (-1, -1), 3),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ]
+        style_commands = list(self._MEMBERS_STATIC_STYLE)
         
         if num_members >= 1:
             span_end = min(4, num_members)
             style_commands.append(('SPAN', (4, 1), (4, span_end)))
         
         members_table.setStyle(TableStyle(style_commands))
-        self.elements.append(members_table)
-        self.elements.append(Spacer(1, 0.15*inch))
+        self.elements.extend((members_table, Spacer(1, 0.15*inch)))
     
-    def add_checklist_section(self, section_title, questions_by_section, responses):
-        """Add checklist questions with responses grouped by section"""
+    def add_checklist_section(self, section_title, questions_by_section, answers):
+        """
+        Add checklist questions with responses grouped by section
+        answers holds one response per question, in questions_by_section order
+        """
         data = []
         
-        header_left = Paragraph(f'<b>{section_title}</b>', 
-                     ParagraphStyle(name='HeaderLeft', parent=self.styles['Normal'], 
-                                  fontSize=10, textColor=colors.white, 
-                                  fontName='Helvetica-Bold', alignment=TA_CENTER))
-        header_right = Paragraph('<b>25 MARKS</b>', 
-                     ParagraphStyle(name='HeaderRight', parent=self.styles['Normal'], 
-                                  fontSize=10, textColor=colors.white, 
-                                  fontName='Helvetica-Bold', alignment=TA_CENTER))
+        header_left = self._shared_paragraph(f'<b>{section_title}</b>', 'ChecklistHeaderLeft')
+        header_right = self._shared_paragraph('<b>25 MARKS</b>', 'ChecklistHeaderRight')
         
         header_row = [header_left, header_right]
         data.append(header_row)
         
+        # Row heights are worked out from the wrapped text up front so the table
+        # doesn't have to wrap every cell again to measure and split itself
+        col_widths = [5.8*inch, 0.7*inch]
+        question_width = col_widths[0] - 12
+        section_width = sum(col_widths) - 12
+        marks_width = col_widths[1] - 12
+        # Both header cells are bold; '25 MARKS' wraps onto two lines in its narrow column
+        row_heights = [max(text_height(section_title, self.styles['ChecklistHeaderLeft'], question_width, bold=True),
+                           text_height('25 MARKS', self.styles['ChecklistHeaderRight'], marks_width, bold=True)) + 12]
+        
+        style_commands = list(self._CHECKLIST_STATIC_STYLE)
+        
+        section_color = self._CHECKLIST_SECTION_COLOR
         question_number = 1
+        section_style = self.styles['ChecklistSection']
+        question_style = self.styles['ChecklistQuestion']
+        min_question_height = question_style.fontSize * 1.2
         
+        # Section rows are styled as they are added, so the sections are walked once
+        answers = iter(answers)
         for section_name, questions in questions_by_section.items():
+            current_row = len(data)
             section_row = [
-                Paragraph(f'<b>{section_name.upper()}</b>', 
-                         ParagraphStyle(name='SectionStyle', parent=self.styles['Normal'],
-                                      fontSize=9, textColor=colors.white,
-                                      fontName='Helvetica-Bold', alignment=TA_CENTER)),
+                self._shared_paragraph(f'<b>{section_name.upper()}</b>', 'ChecklistSection'),
                 ''
             ]
             data.append(section_row)
-            
-            for question in questions:
-                q_id = question['question_id']
-                q_text = question['question_text']
-                
-                formatted_text = f"{question_number}. {q_text}"
-                q_para = Paragraph(formatted_text, 
-                                 ParagraphStyle(name='QuestionStyle', parent=self.styles['Normal'],
-                                              fontSize=9, fontName='Helvetica',
-                                              alignment=TA_LEFT, leading=11))
-                
-                db_key = q_id.replace('.', '_')
-                response = responses.get(db_key, '')
-                
-                q_row = [q_para, response if response else '']
-                data.append(q_row)
-                question_number += 1
-        
-        col_widths = [5.8*inch, 0.7*inch]
-        checklist_table = Table(data, colWidths=col_widths, repeatRows=1)
-        
-        style_commands = [
-            ('BACKGROUND', (0, 0), (1, 0), colors.HexColor("#272727")),
-            ('FONT', (0, 0), (1, 0), 'Helvetica-Bold', 10),
-            ('TEXTCOLOR', (0, 0), (1, 0), colors.white),
-            ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-            ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-            ('LEFTPADDING', (0, 0), (1, 0), 6),
-            ('RIGHTPADDING', (0, 0), (1, 0), 6),
-            ('TOPPADDING', (0, 0), (1, 0), 6),
-            ('BOTTOMPADDING', (0, 0), (1, 0), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONT', (0, 1), (0, -1), 'Helvetica', 9),
-            ('FONT', (1, 1), (1, -1), 'Helvetica-Bold', 9),
-            ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 1), (1, -1), 'CENTER'),
-            ('LEFTPADDING', (0, 1), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 1), (-1, -1), 6),
-            ('TOPPADDING', (0, 1), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
-        ]
-        
-        current_row = 1
-        for section_name, questions in questions_by_section.items():
+            row_heights.append(text_height(section_name.upper(), section_style, section_width, bold=True) + 8)
             style_commands.extend([
-                ('BACKGROUND', (0, current_row), (-1, current_row), colors.HexColor("#7A7979")),
+                ('BACKGROUND', (0, current_row), (-1, current_row), section_color),
                 ('SPAN', (0, current_row), (-1, current_row)),
                 ('FONT', (0, current_row), (-1, current_row), 'Helvetica-Bold', 9),
                 ('TEXTCOLOR', (0, current_row), (-1, current_row), colors.white),
                 ('ALIGN', (0, current_row), (-1, current_row), 'LEFT'),
             ])
-            current_row += 1
-            current_row += len(questions)
+            
+            # (numbered question text, response) per question
+            question_cells = [
+                (f"{number}. {question['question_text']}", answer)
+                for (number, question), answer in zip(enumerate(questions, question_number), answers)
+            ]
+            data.extend([self._shared_paragraph(text, 'ChecklistQuestion'), response]
+                        for text, response in question_cells)
+            row_heights.extend(
+                max(text_height(text, question_style, question_width), min_question_height) + 8
+                for text, _ in question_cells
+            )
+            question_number += len(question_cells)
+        
+        checklist_table = Table(data, colWidths=col_widths, rowHeights=row_heights,
+                                repeatRows=1, splitByRow=1)
         
         checklist_table.setStyle(TableStyle(style_commands))
-        self.elements.append(checklist_table)
-        self.elements.append(Spacer(1, 0.15*inch))
+        self.elements.extend((checklist_table, Spacer(1, 0.15*inch)))
     
     def add_page_break(self, academic_year):
         """Add page break with header on new page"""
         self.elements.append(PageBreak())
         self.add_header(academic_year)
     
-    def add_performance_table(self, members, marks_data, criteria_list):
-        """Add student performance evaluation table"""
-        section_header = Paragraph("<b>STUDENT PERFORMANCE EVALUATION</b>", self.styles['SectionHeader'])
-        self.elements.append(section_header)
-        self.elements.append(Spacer(1, 0.08*inch))
+    def add_performance_table(self, members, marks_data, criteria_list, marks_columns):
+        """
+        Add student performance evaluation table
+        marks_data rows are plain tuples laid out as marks_columns
+        """
+        section_header = self._shared_paragraph("<b>STUDENT PERFORMANCE EVALUATION</b>", 'SectionHeader')
+        self.elements.extend((section_header, Spacer(1, 0.08*inch)))
         
         num_members = len(members)
+        col_idx = {name: i for i, name in enumerate(marks_columns)}
+        roll_idx = col_idx['roll_no']
+        total_idx = col_idx.get('total')
+        marks_by_roll = {row[roll_idx]: row for row in marks_data}
         
         header_row1 = [
-            Paragraph('<b>Students\' Contribution and Performance</b>', 
-                     ParagraphStyle(name='TableHeaderBold', parent=self.styles['Normal'],
-                                  fontSize=9, fontName='Helvetica-Bold', alignment=TA_LEFT)),
+            self._shared_paragraph('<b>Students\' Contribution and Performance</b>', 'PerfHeaderBold'),
             ''
         ] + [''] * num_members
         
         header_row2 = [
             '', '',
-            Paragraph('<b>Marks(25M)</b>', 
-                     ParagraphStyle(name='MarksBold', parent=self.styles['Normal'],
-                                  fontSize=9, fontName='Helvetica-Bold', alignment=TA_CENTER))
+            self._shared_paragraph('<b>Marks(25M)</b>', 'PerfColNum')
         ] + [''] * (num_members - 1)
         
+        group_members_para = self._shared_paragraph('<b>Group Members</b>', 'PerfColNum')
         header_row3 = [
             '', ''
-        ] + [Paragraph('<b>Group Members</b>', 
-                      ParagraphStyle(name='GroupMembersBold', parent=self.styles['Normal'],
-                                   fontSize=9, fontName='Helvetica-Bold', alignment=TA_CENTER))] + [''] * (num_members - 1)
+        ] + [group_members_para] + [''] * (num_members - 1)
         
         header_row4 = [
-            Paragraph('<b>Particulars</b>', 
-                     ParagraphStyle(name='ParticularsBold', parent=self.styles['Normal'],
-                                  fontSize=9, fontName='Helvetica-Bold', alignment=TA_CENTER)),
+            self._shared_paragraph('<b>Particulars</b>', 'PerfColNum'),
             ''
-        ] + [Paragraph(f'<b>{i+1}</b>', 
-                      ParagraphStyle(name='ColNum', parent=self.styles['Normal'],
-                                   fontSize=9, fontName='Helvetica-Bold', alignment=TA_CENTER)) 
-             for i in range(num_members)]
+        ] + [self._shared_paragraph(f'<b>{i+1}</b>', 'PerfColNum') for i in range(num_members)]
         
         data = [header_row1, header_row2, header_row3, header_row4]
         
-        for idx, criterion in enumerate(criteria_list, 1):
-            criteria_id = criterion['criteria_id']
-            criteria_text = criterion['criteria_text']
-            max_marks = criterion['max_marks']
-            
-            criteria_para = Paragraph(f"{criteria_text}", 
-                                    ParagraphStyle(name='CriteriaText', parent=self.styles['Normal'],
-                                                 fontSize=9, fontName='Helvetica', alignment=TA_LEFT))
-            
-            if max_marks > 0:
-                marks_label = Paragraph(f"({int(max_marks)}M)", 
-                                      ParagraphStyle(name='MarksLabel', parent=self.styles['Normal'],
-                                                   fontSize=9, fontName='Helvetica', alignment=TA_CENTER))
-            else:
-                marks_label = ''
-            
-            row = [criteria_para, marks_label]
-            
-            for member in members:
-                member_marks = next((m for m in marks_data if m['roll_no'] == member['roll_no']), None)
-                if member_marks and member_marks.get(criteria_id) is not None:
-                    mark_value = member_marks[criteria_id]
-                    if isinstance(mark_value, str):
-                        row.append(mark_value)
-                    elif mark_value == int(mark_value):
-                        row.append(str(int(mark_value)))
-                    else:
-                        row.append(str(mark_value))
-                else:
-                    row.append('')
-            data.append(row)
+        # Each member's marks row (or None) in column order, and each criterion's marks column
+        member_rows = [marks_by_roll.get(member['roll_no']) for member in members]
+        criteria_cols = [(criterion, col_idx.get(criterion['criteria_id'])) for criterion in criteria_list]
         
-        total_row = [
-            Paragraph('<b>Total(25M)</b>', 
-                     ParagraphStyle(name='TotalBold', parent=self.styles['Normal'],
-                                  fontSize=9, fontName='Helvetica-Bold', alignment=TA_LEFT)),
+        data.extend(
+            [
+                self._shared_paragraph(f"{criterion['criteria_text']}", 'PerfCriteria'),
+                self._shared_paragraph(f"({int(criterion['max_marks'])}M)", 'PerfMarksLabel') if criterion['max_marks'] > 0 else ''
+            ] + [format_mark(row, mark_idx, '') for row in member_rows]
+            for criterion, mark_idx in criteria_cols
+        )
+        
+        data.append([
+            self._shared_paragraph('<b>Total(25M)</b>', 'PerfTotalBold'),
             ''
-        ]
-        for member in members:
-            member_marks = next((m for m in marks_data if m['roll_no'] == member['roll_no']), None)
-            if member_marks and member_marks.get('total') is not None:
-                total = member_marks['total']
-                total_str = str(int(total)) if total == int(total) else str(total)
-                total_row.append(Paragraph(f'<b>{total_str}</b>', 
-                                          ParagraphStyle(name='TotalValue', parent=self.styles['Normal'],
-                                                       fontSize=9, fontName='Helvetica-Bold', alignment=TA_CENTER)))
-            else:
-                total_row.append(Paragraph('<b>0</b>', 
-                                          ParagraphStyle(name='TotalZero', parent=self.styles['Normal'],
-                                                       fontSize=9, fontName='Helvetica-Bold', alignment=TA_CENTER)))
-        data.append(total_row)
+        ] + [format_mark(row, total_idx, '0') for row in member_rows])
         
         particulars_col1 = 3.0*inch
         particulars_col2 = 0.7*inch
@@ -455,35 +583,21 @@ class GenericReviewPDFGenerator:
         col_widths = [particulars_col1, particulars_col2] + [member_width] * num_members
         perf_table = Table(data, colWidths=col_widths)
         
-        style_commands = [
-            ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ALIGN', (2, 4), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 0), (-1, 3), 'CENTER'),
-            ('ALIGN', (0, 4), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 4), (1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-            ('TOPPADDING', (0, 0), (-1, -1), 3),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+        style_commands = list(self._PERFORMANCE_STATIC_STYLE) + [
             ('SPAN', (0, 0), (num_members + 1, 0)),
             ('SPAN', (2, 1), (num_members + 1, 1)),
             ('SPAN', (2, 2), (num_members + 1, 2)),
-            ('SPAN', (0, 3), (1, 3)),
-            ('SPAN', (0, 1), (1, 2)),
         ]
         
         for i in range(4, len(data)):
             style_commands.append(('SPAN', (0, i), (1, i)))
         
         perf_table.setStyle(TableStyle(style_commands))
-        self.elements.append(perf_table)
-        self.elements.append(Spacer(1, 0.12*inch))
+        self.elements.extend((perf_table, Spacer(1, 0.12*inch)))
     
     def add_comments_section(self, comments):
         """Add comments section"""
-        comments_header = Paragraph("<b>Comments (if any) :</b>", self.styles['CustomNormal'])
+        comments_header = self._shared_paragraph("<b>Comments (if any) :</b>", 'CustomNormal')
         self.elements.append(comments_header)
         
         comments_text = comments if comments else ''
@@ -494,63 +608,37 @@ class GenericReviewPDFGenerator:
         
         self.elements.append(Spacer(1, 0.15*inch))
         
-        note_style = ParagraphStyle(
-            name='NoteStyle',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            fontName='Helvetica',
-            alignment=TA_LEFT,
-            leftIndent=20
-        )
-        
         notes = [
             "# To be filled by internal guide &amp; reviewer(s) only.",
             "* Whether the presentation / evaluation schedule. : YES / NO (If NO mention the reasons for same.)"
         ]
         
         for note in notes:
-            note_para = Paragraph(note, note_style)
-            self.elements.append(note_para)
-            self.elements.append(Spacer(1, 0.03*inch))
+            note_para = self._shared_paragraph(note, 'NoteStyle')
+            self.elements.extend((note_para, Spacer(1, 0.03*inch)))
         
         self.elements.append(Spacer(1, 0.12*inch))
     
     def add_deliverables_section(self, deliverables):
         """Add review deliverables list"""
-        deliverables_title = Paragraph(f"<b>Review – {self.review_roman}: Deliverables</b>", 
-                                       ParagraphStyle(name='DeliverableTitle', 
-                                                    parent=self.styles['Normal'],
-                                                    fontSize=10,
-                                                    fontName='Helvetica-Bold',
-                                                    textColor=colors.HexColor('#CC0000'),
-                                                    alignment=TA_LEFT,
-                                                    spaceAfter=6,leftIndent=20))
-        self.elements.append(deliverables_title)
-        self.elements.append(Spacer(1, 0.05*inch))
-        
-        deliverable_style = ParagraphStyle(
-            name='DeliverableItem',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            fontName='Helvetica',
-            alignment=TA_LEFT,
-            leftIndent=22,
-            bulletIndent=5
-        )
+        deliverables_title = self._shared_paragraph(f"<b>Review – {self.review_roman}: Deliverables</b>", 
+                                                    'DeliverableTitle')
+        self.elements.extend((deliverables_title, Spacer(1, 0.05*inch)))
         
-        for item in deliverables:
-            item_para = Paragraph(f"• {item['deliverable_text']}", deliverable_style)
-            self.elements.append(item_para)
-            self.elements.append(Spacer(1, 0.02*inch))
+        # One list flowable lays out every item, instead of a Paragraph and Spacer each
+        items = [ListItem(self._shared_paragraph(item['deliverable_text'], 'DeliverableItem'))
+                 for item in deliverables]
+        self.elements.append(ListFlowable(items, bulletType='bullet', start='•',
+                                          leftIndent=22, bulletFontName='Helvetica',
+                                          bulletFontSize=9, bulletColor=colors.black))
         
         self.elements.append(Spacer(1, 0.15*inch))
     
     def add_signatures(self, guide_name=None, reviewer1_name=None, reviewer2_name=None):
         """Add signature section"""
-        sig_header = Paragraph("<b>Name &amp; Signature of evaluation committee -</b>", 
-                              self.styles['CustomNormal'])
-        self.elements.append(sig_header)
-        self.elements.append(Spacer(1, 0.4*inch))
+        sig_header = self._shared_paragraph("<b>Name &amp; Signature of evaluation committee -</b>", 
+                                            'CustomNormal')
+        self.elements.extend((sig_header, Spacer(1, 0.4*inch)))
         
         # Row 1: Labels
         label_row = ['Name of Reviewer 1', 'Name of Reviewer 2', 'Name of Internal Guide']
@@ -565,65 +653,353 @@ class GenericReviewPDFGenerator:
         sig_data = [label_row, name_row]
         
         sig_table = Table(sig_data, colWidths=[2.17*inch, 2.17*inch, 2.17*inch])
-        sig_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (-1, -1), 'Helvetica', 9),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ]))
+        sig_table.setStyle(self._SIGNATURE_STYLE)
         
         self.elements.append(sig_table)
            
     def build(self):
-        """Build the PDF"""
+        """Build the PDF; returns the PDF bytes when writing to a path"""
         self.doc.build(self.elements)
-        print(f"PDF generated: {self.output_path}")
+        if isinstance(self.output_path, str):
+            pdf_bytes = self._buffer.getvalue()
+            write_pdf_output(self.output_path, pdf_bytes)
+            return pdf_bytes
+        print("PDF generated in memory")
+        return None
+
+
+# Shared by every generator instance
+STYLES = GenericReviewPDFGenerator.build_stylesheet()
+
+
+@lru_cache(maxsize=SHARED_PARAGRAPH_CACHE_SIZE)
+def shared_paragraph(text, style_name):
+    """Paragraph parsed once per (markup, style name); copy it before use"""
+    return Paragraph(text, STYLES[style_name])
+
+# Review 5 summary sheet tables
+SUMMARY_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (2, 1), (2, -1), 'LEFT'), # Align student names to the left
+])
+
+COMMENTS_TABLE_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 5),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+])
+
+
+@lru_cache(maxsize=8)
+def academic_year_label(start_year):
+    """Academic year label such as 2025-26 for the year starting in start_year"""
+    return f"{start_year}-{str(start_year + 1)[2:]}"
+
+
+def format_mark(row, idx, default):
+    """Format a marks cell: whole numbers without a decimal point, default when missing"""
+    if row is None or idx is None or row[idx] is None:
+        return default
+    value = row[idx]
+    if isinstance(value, str):
+        return value
+    return str(int(value)) if value == int(value) else str(value)
+
+
+def text_height(text, style, width, bold=False):
+    """
+    Height of text wrapped to width in a paragraph style (one font; pass bold=True
+    for text wrapped in <b>, which renders in the bold face of the style's font)
+    """
+    font_name = tt2ps(ps2tt(style.fontName)[0], 1, 0) if bold else style.fontName
+    return max(1, len(simpleSplit(text, font_name, style.fontSize, width))) * style.leading
+
+
+@lru_cache(maxsize=256)
+def guide_details_markup(guide_name, mentor_name, mentor_mobile, mentor_email):
+    """Guide/mentor cell markup; many groups share a guide, so it is built once per guide"""
+    return (f"Guide Name : {guide_name}<br/><br/>"
+            f"Mentor Name: {mentor_name}<br/><br/>"
+            f"Mentor Mobile No. & Email :<br/>"
+            f"{mentor_mobile} {mentor_email}")
+
+
+@lru_cache(maxsize=4)
+def load_logo_bytes(path):
+    """
+    Read a logo file once per process, re-encoded as a compact JPEG sized for
+    the 0.8 inch header at 300 dpi. Returns None when it can't be read.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        print(f"Logo not found at path: {path} ({e})")
+        return None
+    
+    try:
+        with PILImage.open(io.BytesIO(data)) as img:
+            img.thumbnail((LOGO_PIXELS, LOGO_PIXELS))
+            # JPEG has no alpha channel; flatten transparency onto the white page
+            flat = PILImage.new('RGB', img.size, 'white')
+            rgba = img.convert('RGBA')
+            flat.paste(rgba, mask=rgba.getchannel('A'))
+            out = io.BytesIO()
+            flat.save(out, 'JPEG', quality=85, optimize=True)
+            return out.getvalue()
+    except Exception as e:
+        print(f"Could not re-encode logo, embedding it as-is: {e}")
+        return data
+
+
+def pdf_data_fingerprint(*parts):
+    """Hash the rows a PDF is rendered from, so any data change gives a new cache key"""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def get_cached_pdf(key):
+    """Return cached PDF bytes for key, or None"""
+    with _pdf_cache_lock:
+        pdf_bytes = _pdf_cache.get(key)
+        if pdf_bytes is not None:
+            _pdf_cache.move_to_end(key)
+        return pdf_bytes
+
+
+def store_cached_pdf(key, pdf_bytes):
+    """Cache rendered PDF bytes, evicting the least recently used entries"""
+    with _pdf_cache_lock:
+        _pdf_cache[key] = pdf_bytes
+        _pdf_cache.move_to_end(key)
+        while len(_pdf_cache) > PDF_CACHE_SIZE:
+            _pdf_cache.popitem(last=False)
+
+
+@contextmanager
+def pdf_render_lock(review_number, group_id):
+    """Per-report lock so identical concurrent requests render only once"""
+    key = (review_number, group_id)
+    with _pdf_cache_lock:
+        entry = _pdf_render_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _pdf_cache_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del _pdf_render_locks[key]
+
+
+def write_pdf_output(target, pdf_bytes):
+    """Write rendered PDF bytes to a path or a writable stream"""
+    if hasattr(target, 'write'):
+        target.write(pdf_bytes)
+    else:
+        with open(target, 'wb') as f:
+            f.write(pdf_bytes)
+    
+    if isinstance(target, str):
+        print(f"PDF generated: {target}")
+
+
+def resolve_pdf_output(output, default_filename):
+    """
+    Resolve where a PDF is written.
+    output may be a writable binary stream (e.g. io.BytesIO), returned as-is with
+    no filename, or a filename/path saved under frontend/static/pdfs.
+    Returns (filename, target)
+    """
+    if hasattr(output, 'write'):
+        return None, output
+    
+    filename = output or default_filename
+    output_path = os.path.join('frontend', 'static', 'pdfs', filename)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    return filename, output_path
+
+
+# COMMENT the sp_review<N>_bundle procedures must carry; bump it together with
+# final_Preview_Schema.sql whenever review_bundle_queries changes
+REVIEW_BUNDLE_PROCEDURE_VERSION = 'v1'
+
+
+def review_bundle_queries(review_number, marks_columns):
+    """
+    Per-group queries behind a review PDF, in result-set order. sp_review<N>_bundle
+    (installed by final_Preview_Schema.sql) runs the same statements with its gid
+    parameter in place of %s, except that it selects every marks column since the
+    criteria columns vary; rows are read by column name, so either layout works.
+    marks_columns are the review<N>_marks columns the PDF reads.
+    """
+    return (
+        # 1. Project info
+        """
+            SELECT group_id, project_title, guide_name, mentor_name, mentor_mobile, mentor_email 
+            FROM projects 
+            WHERE group_id = %s
+        """,
+        # 2. Members
+        """
+            SELECT roll_no, student_name, contact_details 
+            FROM members 
+            WHERE group_id = %s 
+            ORDER BY roll_no
+        """,
+        # 3. Marks
+        f"""
+            SELECT {', '.join(f'`{column}`' for column in marks_columns)} 
+            FROM review{review_number}_marks 
+            WHERE group_id = %s 
+            ORDER BY roll_no
+        """,
+        # 4. Questionnaire responses
+        f"""
+            SELECT * FROM review{review_number}_group_responses 
+            WHERE group_id = %s
+        """,
+        # 5. Panel assignments for reviewer names
+        """
+            SELECT reviewer1, reviewer2, guide 
+            FROM panel_assignments 
+            WHERE group_id = %s
+        """,
+    )
+
+
+def review_static_queries(review_number):
+    """Queries for a review's questions, criteria and deliverables (the same for every group)"""
+    return (
+        f"""
+            SELECT question_id, section, question_text, display_order 
+            FROM review{review_number}_questions 
+            ORDER BY display_order
+        """,
+        f"""
+            SELECT criteria_id, criteria_text, max_marks, display_order 
+            FROM review{review_number}_performance_criteria 
+            ORDER BY display_order
+        """,
+        f"""
+            SELECT deliverable_text 
+            FROM review{review_number}_deliverables 
+            ORDER BY display_order
+        """,
+    )
+
+# review_number -> (expires_at, static review data); refreshed after REVIEW_STATIC_TTL seconds
+REVIEW_STATIC_TTL = int(os.getenv('REVIEW_STATIC_TTL', 300))
+_review_static_cache = {}
+_review_static_lock = threading.Lock()
+
+
+def get_review_static(conn, review_number):
+    """
+    Questions, criteria and deliverables for a review, queried at most once per
+    REVIEW_STATIC_TTL. Returns (questions, questions_by_section, criteria_list,
+    deliverables, marks_columns); rows are read-only mappings since they are
+    shared between requests. marks_columns lists the review<N>_marks columns the
+    PDF reads: roll_no, each criterion that has a column, and total.
+    """
+    now = time.monotonic()
+    with _review_static_lock:
+        cached = _review_static_cache.get(review_number)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    cursor = conn.cursor(prepared=True)
+    results = []
+    for query in review_static_queries(review_number):
+        cursor.execute(query)
+        results.append(tuple(MappingProxyType(row) for row in rows_as_dicts((cursor.column_names, cursor.fetchall()))))
+    questions, criteria_list, deliverables = results
+    
+    cursor.execute("""
+        SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+    """, (f"review{review_number}_marks",))
+    existing_columns = {row[0] for row in cursor.fetchall()}
+    marks_columns = ('roll_no',) + tuple(
+        c['criteria_id'] for c in criteria_list
+        if c['criteria_id'] in existing_columns and c['criteria_id'] not in ('roll_no', 'total')
+    ) + (('total',) if 'total' in existing_columns else ())
+    
+    # Group questions by section; dicts keep first-seen section order
+    questions_by_section = {}
+    for q in questions:
+        questions_by_section.setdefault(q['section'], []).append(q)
+    
+    value = (questions, MappingProxyType(questions_by_section), criteria_list, deliverables, marks_columns)
+    with _review_static_lock:
+        _review_static_cache[review_number] = (now + REVIEW_STATIC_TTL, value)
+    return value
+
+
+def fetch_review_bundle(conn, review_number, group_id, marks_columns):
+    """
+    Run the review PDF queries for a group, in one round-trip when the stored
+    procedure is available. Returns (column_names, rows) per query, with rows
+    as plain tuples.
+    """
+    results = call_procedure(conn, f"sp_review{review_number}_bundle", REVIEW_BUNDLE_PROCEDURE_VERSION, (group_id,))
+    if results is not None:
+        return results
+    
+    queries = review_bundle_queries(review_number, marks_columns)
+    # Without the procedure, run the queries as server-side prepared statements
+    # so MySQL parses each once and group_id travels over the binary protocol
+    cursor = conn.cursor(prepared=True)
+    results = []
+    for query in queries:
+        cursor.execute(query, (group_id,) * query.count('%s'))
+        results.append((cursor.column_names, cursor.fetchall()))
+    return results
+
+
+def rows_as_dicts(result):
+    """Turn one (column_names, rows) result into a list of row dicts"""
+    columns, rows = result
+    return [dict(zip(columns, row)) for row in rows]
 
 
 def generate_review_pdf(review_number, group_id, output_filename=None):
-    """Generic function to generate PDF for any review"""
+    """
+    Generic function to generate PDF for any review
+    output_filename may also be a writable binary stream to render into memory
+    """
+    # review_number is interpolated into table names, so only known reviews are allowed
+    if not validate_review_number(review_number):
+        return {'success': False, 'error': f'Invalid review number: {review_number}'}
+    
     conn = get_connection()
     if not conn:
         return {'success': False, 'error': 'Database connection failed'}
     
     try:
-        cursor = conn.cursor(dictionary=True)
+        questions, questions_by_section, criteria_list, deliverables, marks_columns = get_review_static(conn, review_number)
         
-        # Fetch project info
-        cursor.execute("SELECT * FROM projects WHERE group_id = %s", (group_id,))
-        project_data = cursor.fetchone()
+        # All per-group result sets arrive together
+        results = fetch_review_bundle(conn, review_number, group_id, marks_columns)
         
+        # Marks stay as tuples (indexed by column position per cell); the rest become dicts
+        marks_columns, marks_data = results[2]
+        project_rows, members, response_rows, panel_rows = [
+            rows_as_dicts(r) for i, r in enumerate(results) if i != 2
+        ]
+        
+        project_data = project_rows[0] if project_rows else None
         if not project_data:
             return {'success': False, 'error': f'No project found for group {group_id}'}
         
-        # Fetch members
-        cursor.execute("""
-            SELECT roll_no, student_name, contact_details 
-            FROM members 
-            WHERE group_id = %s 
-            ORDER BY roll_no
-        """, (group_id,))
-        members = cursor.fetchall()
-        
         if not members:
             return {'success': False, 'error': f'No members found for group {group_id}'}
         
-        # Fetch marks
-        cursor.execute(f"""
-            SELECT * FROM review{review_number}_marks 
-            WHERE group_id = %s 
-            ORDER BY roll_no
-        """, (group_id,))
-        marks_data = cursor.fetchall()
-        
-        # Fetch questionnaire responses
-        cursor.execute(f"""
-            SELECT * FROM review{review_number}_group_responses 
-            WHERE group_id = %s
-        """, (group_id,))
-        responses_data = cursor.fetchone()
-        
+        responses_data = response_rows[0] if response_rows else None
         if not responses_data:
             return {'success': False, 'error': f'No review responses found for group {group_id}'}
         
@@ -635,49 +1011,12 @@ def generate_review_pdf(review_number, group_id, output_filename=None):
         else:
             # If it's already a date object
             formatted_date = submission_date.strftime('%d/%m/%Y')
-        # Fetch questions
-        cursor.execute(f"""
-            SELECT question_id, section, question_text, display_order 
-            FROM review{review_number}_questions 
-            ORDER BY display_order
-        """)
-        questions = cursor.fetchall()
-        
-        # Group questions by section
-        questions_by_section = {}
-        section_order = []
-        for q in questions:
-            section = q['section']
-            if section not in questions_by_section:
-                questions_by_section[section] = []
-                section_order.append(section)
-            questions_by_section[section].append(q)
-        
-        ordered_questions = {section: questions_by_section[section] for section in section_order}
-        
-        # Fetch performance criteria
-        cursor.execute(f"""
-            SELECT criteria_id, criteria_text, max_marks, display_order 
-            FROM review{review_number}_performance_criteria 
-            ORDER BY display_order
-        """)
-        criteria_list = cursor.fetchall()
         
-        # Fetch deliverables
-        cursor.execute(f"""
-            SELECT deliverable_text 
-            FROM review{review_number}_deliverables 
-            ORDER BY display_order
-        """)
-        deliverables = cursor.fetchall()
+        panel_data = panel_rows[0] if panel_rows else None
         
-        # ADD THIS CODE HERE - Fetch panel assignments for reviewer names
-        cursor.execute("""
-            SELECT reviewer1, reviewer2, guide 
-            FROM panel_assignments 
-            WHERE group_id = %s
-        """, (group_id,))
-        panel_data = cursor.fetchone()
+        # Everything is fetched; hand the connection back to the pool before rendering
+        close_connection(conn)
+        conn = None
 
         reviewer1_name = None
         reviewer2_name = None
@@ -691,49 +1030,71 @@ def generate_review_pdf(review_number, group_id, output_filename=None):
         # Use guide from panel_assignments if available, otherwise use from projects table
         final_guide_name = guide_from_panel if guide_from_panel else project_data.get('guide_name', 'N/A')
 
-        # Prepare output filename
-        if not output_filename:
-            output_filename = f"Review{review_number}_{group_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        
-        output_path = os.path.join('frontend', 'static', 'pdfs', output_filename)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        # Generate PDF
-        pdf = GenericReviewPDFGenerator(output_path, review_number)
-        academic_year = pdf.calculate_academic_year(submission_date)
-        
-        # Determine section title for checklist
-        review_roman = REVIEW_ROMAN.get(review_number, str(review_number))
-        if review_number == 1:
-            section_title = f"REVIEW – {review_roman} CHECKLIST : FINALIZATION OF SCOPE"
-        elif review_number == 2 or review_number == 0:
-            section_title = f"REVIEW – {review_roman} CHECKLIST : DESIGN"
-        elif review_number == 3:
-            section_title = f"REVIEW – {review_roman} CHECKLIST : IMPLEMENTATION"
-        elif review_number == 4:
-            section_title = f"REVIEW – {review_roman} CHECKLIST : TESTING"
-        else:
-            section_title = f"REVIEW – {review_roman} CHECKLIST"
-        
-        # Page 1
-        pdf.add_header(academic_year)
-        pdf.add_project_info(project_data, formatted_date)
-        pdf.add_members_table(members, {
-            'guide_name': project_data.get('guide_name', 'N/A'),
-            'mentor_name': project_data.get('mentor_name', 'N/A'),
-            'mentor_mobile': project_data.get('mentor_mobile', 'N/A'),
-            'mentor_email': project_data.get('mentor_email', 'N/A')
-        })
-        pdf.add_checklist_section(section_title, ordered_questions, responses_data)
-        
-        # Page 2
-        pdf.add_page_break(academic_year)
-        pdf.add_performance_table(members, marks_data, criteria_list)
-        pdf.add_comments_section(responses_data.get('comments'))
-        pdf.add_deliverables_section(deliverables)
-        pdf.add_signatures(final_guide_name, reviewer1_name, reviewer2_name)
+        # Prepare output filename (or in-memory stream)
+        output_filename, output_path = resolve_pdf_output(
+            output_filename,
+            f"Review{review_number}_{group_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        )
         
-        pdf.build()
+        # Reuse the rendered PDF when none of its source data has changed
+        cache_key = (review_number, group_id, pdf_data_fingerprint(
+            project_data, members, marks_data, responses_data,
+            questions, criteria_list, deliverables, panel_data
+        ))
+        
+        # Concurrent requests for the same report wait for one render
+        with pdf_render_lock(review_number, group_id):
+            pdf_bytes = get_cached_pdf(cache_key)
+            if pdf_bytes is not None:
+                print(f"Using cached PDF: Review {review_number}, Group {group_id}")
+            else:
+                # Generate PDF
+                buffer = io.BytesIO()
+                pdf = GenericReviewPDFGenerator(buffer, review_number)
+                academic_year = pdf.calculate_academic_year(submission_date)
+                
+                # Determine section title for checklist
+                review_roman = REVIEW_ROMAN.get(review_number, str(review_number))
+                if review_number == 1:
+                    section_title = f"REVIEW – {review_roman} CHECKLIST : FINALIZATION OF SCOPE"
+                elif review_number == 2 or review_number == 0:
+                    section_title = f"REVIEW – {review_roman} CHECKLIST : DESIGN"
+                elif review_number == 3:
+                    section_title = f"REVIEW – {review_roman} CHECKLIST : IMPLEMENTATION"
+                elif review_number == 4:
+                    section_title = f"REVIEW – {review_roman} CHECKLIST : TESTING"
+                else:
+                    section_title = f"REVIEW – {review_roman} CHECKLIST"
+                
+                # Page 1
+                pdf.add_header(academic_year)
+                pdf.add_project_info(project_data, formatted_date)
+                pdf.add_members_table(members, {
+                    'guide_name': project_data.get('guide_name', 'N/A'),
+                    'mentor_name': project_data.get('mentor_name', 'N/A'),
+                    'mentor_mobile': project_data.get('mentor_mobile', 'N/A'),
+                    'mentor_email': project_data.get('mentor_email', 'N/A')
+                })
+                # Responses are keyed by question_id with dots replaced by underscores
+                answers = [
+                    responses_data.get(question['question_id'].replace('.', '_'), '') or ''
+                    for section_questions in questions_by_section.values()
+                    for question in section_questions
+                ]
+                pdf.add_checklist_section(section_title, questions_by_section, answers)
+                
+                # Page 2
+                pdf.add_page_break(academic_year)
+                pdf.add_performance_table(members, marks_data, criteria_list, marks_columns)
+                pdf.add_comments_section(responses_data.get('comments'))
+                pdf.add_deliverables_section(deliverables)
+                pdf.add_signatures(final_guide_name, reviewer1_name, reviewer2_name)
+                
+                pdf.build()
+                pdf_bytes = buffer.getvalue()
+                store_cached_pdf(cache_key, pdf_bytes)
+        
+        write_pdf_output(output_path, pdf_bytes)
         
         return {
             'success': True,
@@ -778,26 +1139,25 @@ def generate_review5_pdf(group_id, output_filename=None):
     """
     Generate the final summary PDF (Review 5) for a given group.
     """
-    from backend.finalSheet import get_final_summary_data, get_overall_comments
+    from backend.finalSheet import get_cached_final_summary
 
-    # 1. Fetch all necessary data
-    summary_data = get_final_summary_data(group_id)
+    # 1. Fetch all necessary data (repeat downloads reuse it until the group changes)
+    summary_data, overall_comments = get_cached_final_summary(group_id)
     
     if not summary_data:
         return {'success': False, 'error': f'No summary data found for group {group_id}'}
 
-    overall_comments = get_overall_comments(group_id) or ''
+    overall_comments = overall_comments or ''
 
     group_info = summary_data['group_info']
     members = summary_data['members']
-    review_marks = summary_data['review_marks']
+    flat_marks = summary_data['flat_marks']
 
-    # 2. Prepare output filename and path
-    if not output_filename:
-        output_filename = f"Review5_Final_Summary_{group_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-    
-    output_path = os.path.join('frontend', 'static', 'pdfs', output_filename)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # 2. Prepare output filename and path (or in-memory stream)
+    output_filename, output_path = resolve_pdf_output(
+        output_filename,
+        f"Review5_Final_Summary_{group_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    )
 
     # 3. Setup PDF generator
     # We can reuse the GenericReviewPDFGenerator for its setup and some basic styles
@@ -805,13 +1165,11 @@ def generate_review5_pdf(group_id, output_filename=None):
     pdf.review_roman = "I to IV" # Override for the title
     
     # Manually calculate academic year as there is no submission date for review 5
-    academic_year = f"{datetime.now().year}-{str(datetime.now().year + 1)[2:]}"
+    academic_year = academic_year_label(datetime.now().year)
 
     # 4. Build PDF content
     # Header
     pdf.add_header(academic_year)
-    pdf.elements.append(Paragraph("Summary of Project Work Evaluation Sheet", pdf.styles['CustomSubtitle']))
-    pdf.elements.append(Spacer(1, 0.2 * inch))
 
     # Summary Table
     table_header = ['Sr.No.', 'Roll No.', 'Name of the Student', 'I', 'II', 'III', 'IV', 'Total', 'Student Signature']
@@ -819,15 +1177,11 @@ def generate_review5_pdf(group_id, output_filename=None):
     
     for i, member in enumerate(members, 1):
         roll_no = member['roll_no']
-        
-        r1_marks = float(review_marks.get('review1', {}).get(roll_no, 0) or 0)
-        r2_marks = float(review_marks.get('review2', {}).get(roll_no, 0) or 0)
-        r3_marks = float(review_marks.get('review3', {}).get(roll_no, 0) or 0)
-        r4_marks = float(review_marks.get('review4', {}).get(roll_no, 0) or 0)
-        
+        r1_marks, r2_marks, r3_marks, r4_marks = (
+            float(flat_marks.get((review_num, roll_no), 0) or 0) for review_num in (1, 2, 3, 4)
+        )
         total_marks = r1_marks + r2_marks + r3_marks + r4_marks
-        total_str = f"{total_marks:.0f}" if total_marks == int(total_marks) else f"{total_marks:.1f}"
-
+        total_str = f"{total_marks:.0f}" if total_marks.is_integer() else f"{total_marks:.1f}"
 
         row = [
             str(i),
@@ -843,16 +1197,9 @@ def generate_review5_pdf(group_id, output_filename=None):
         table_data.append(row)
 
     col_widths = [0.5*inch, 0.8*inch, 1.7*inch, 0.5*inch, 0.5*inch, 0.5*inch, 0.5*inch, 0.7*inch, 1.3*inch]
-    summary_table = Table(table_data, colWidths=col_widths)
-    summary_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ALIGN', (2, 1), (2, -1), 'LEFT'), # Align student names to the left
-    ]))
-    pdf.elements.append(summary_table)
-    pdf.elements.append(Spacer(1, 0.2 * inch))
+    # LongTable uses the layout optimised for tables spanning pages; the header row repeats on each page
+    summary_table = LongTable(table_data, colWidths=col_widths, repeatRows=1)
+    summary_table.setStyle(SUMMARY_TABLE_STYLE)
 
     # Overall Remarks
     total_table_width = sum(col_widths)
@@ -861,14 +1208,15 @@ def generate_review5_pdf(group_id, output_filename=None):
         [Paragraph(overall_comments.replace('\n', '<br/>\n'), pdf.styles['Normal'])]
     ]
     comments_table = Table(comments_data, colWidths=[total_table_width], rowHeights=[0.3*inch, 1.5*inch])
-    comments_table.setStyle(TableStyle([
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 5),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
-    ]))
-    pdf.elements.append(comments_table)
-    pdf.elements.append(Spacer(1, 0.5 * inch))
+    comments_table.setStyle(COMMENTS_TABLE_STYLE)
+    pdf.elements.extend((
+        Paragraph("Summary of Project Work Evaluation Sheet", pdf.styles['CustomSubtitle']),
+        Spacer(1, 0.2 * inch),
+        summary_table,
+        Spacer(1, 0.2 * inch),
+        comments_table,
+        Spacer(1, 0.5 * inch),
+    ))
 
     # Signatures
     guide_name = group_info.get('guide_name', 'N/A')
@@ -5,13 +5,6 @@ import logging
 import io
 import pandas as pd
 from datetime import datetime
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus.tableofcontents import TableOfContents
 import backend.sheet1 as sheet1  # For database connection
 from backend.db import get_connection, close_connection
 
@@ -338,6 +331,13 @@ def sync_evaluator_data():
 # --- ENHANCED PDF WITH DYNAMIC CELL HEIGHT AND BATCH TERMINOLOGY ---
 @bp.route('/api/generate-schedule-pdf', methods=['POST'])
 def generate_schedule_pdf():
+    # ReportLab is imported here so server start-up doesn't pay for it
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+
     try:
         # Get schedule data using EXACT working database query
         conn = get_connection()
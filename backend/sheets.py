@@ -0,0 +1,44 @@
+# backend/sheets.py
+"""
+Per-review wrappers around commonBackend.
+backend.sheet0 ... backend.sheet4 are built here by make_sheet (and registered
+by backend/__init__.py), so `from backend.sheet2 import save_review2_marks`
+keeps working without five copies of the same module.
+"""
+import sys
+from functools import partial
+from types import SimpleNamespace
+
+from backend.commonBackend import (
+    update_review_attendance,
+    get_group_members_for_review,
+    save_review_marks,
+    get_review_marks,
+    save_review_responses,
+    get_review_responses
+)
+
+# Review numbers that have a backend.sheet<N> module
+SHEET_REVIEWS = range(5)
+
+
+def make_sheet(review_number):
+    """Build the backend.sheet<N> namespace with the review number bound in"""
+    n = review_number
+    return SimpleNamespace(**{
+        '__name__': f'backend.sheet{n}',
+        f'update_review{n}_attendance': partial(update_review_attendance, n),
+        'get_group_members': partial(get_group_members_for_review, n),
+        f'save_review{n}_marks': partial(save_review_marks, n),
+        f'get_review{n}_marks': partial(get_review_marks, n),
+        f'save_review{n}_responses': partial(save_review_responses, n),
+        f'get_review{n}_responses': partial(get_review_responses, n),
+    })
+
+
+def register_sheets(package):
+    """Expose every sheet as an importable submodule of package"""
+    for n in SHEET_REVIEWS:
+        sheet = make_sheet(n)
+        sys.modules[f'{package.__name__}.sheet{n}'] = sheet
+        setattr(package, f'sheet{n}', sheet)
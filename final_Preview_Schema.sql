@@ -653,6 +653,185 @@ CREATE TABLE IF NOT EXISTS final_sheet (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 
+-- Final summary fetch in one round-trip. The app only calls this procedure (it never
+-- creates it) and checks that its COMMENT matches FINAL_SUMMARY_PROCEDURE_VERSION in
+-- backend/finalSheet.py; re-run this block after changing either.
+DROP PROCEDURE IF EXISTS sp_final_summary;
+DELIMITER //
+CREATE PROCEDURE sp_final_summary(IN gid VARCHAR(50))
+COMMENT 'v1'
+BEGIN
+    SELECT p.group_id, p.project_title, p.guide_name, p.mentor_name, p.division,
+           p.project_domain, p.evaluator1_name, p.evaluator2_name,
+           pa.group_id AS panel_group_id, pa.reviewer1, pa.reviewer2, pa.guide
+    FROM projects p
+    LEFT JOIN panel_assignments pa ON pa.group_id = p.group_id
+    WHERE p.group_id = gid;
+
+    SELECT roll_no, student_name, review1_attendance, review2_attendance,
+           review3_attendance, review4_attendance
+    FROM members
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT 1 AS review_num, JSON_OBJECTAGG(roll_no, total) AS marks FROM review1_marks WHERE group_id = gid
+    UNION ALL SELECT 2 AS review_num, JSON_OBJECTAGG(roll_no, total) AS marks FROM review2_marks WHERE group_id = gid
+    UNION ALL SELECT 3 AS review_num, JSON_OBJECTAGG(roll_no, total) AS marks FROM review3_marks WHERE group_id = gid
+    UNION ALL SELECT 4 AS review_num, JSON_OBJECTAGG(roll_no, total) AS marks FROM review4_marks WHERE group_id = gid;
+END //
+DELIMITER ;
+
+
+-- Review PDF data (project, members, marks, responses, panel) in one round-trip,
+-- one procedure per review since each review has its own tables. The app only calls
+-- them and checks that their COMMENT matches REVIEW_BUNDLE_PROCEDURE_VERSION in
+-- backend/pdf_generator.py; re-run this block after changing either.
+
+DROP PROCEDURE IF EXISTS sp_review0_bundle;
+DELIMITER //
+CREATE PROCEDURE sp_review0_bundle(IN gid VARCHAR(50))
+COMMENT 'v1'
+BEGIN
+    SELECT group_id, project_title, guide_name, mentor_name, mentor_mobile, mentor_email
+    FROM projects
+    WHERE group_id = gid;
+
+    SELECT roll_no, student_name, contact_details
+    FROM members
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review0_marks
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review0_group_responses
+    WHERE group_id = gid;
+
+    SELECT reviewer1, reviewer2, guide
+    FROM panel_assignments
+    WHERE group_id = gid;
+END //
+DELIMITER ;
+
+DROP PROCEDURE IF EXISTS sp_review1_bundle;
+DELIMITER //
+CREATE PROCEDURE sp_review1_bundle(IN gid VARCHAR(50))
+COMMENT 'v1'
+BEGIN
+    SELECT group_id, project_title, guide_name, mentor_name, mentor_mobile, mentor_email
+    FROM projects
+    WHERE group_id = gid;
+
+    SELECT roll_no, student_name, contact_details
+    FROM members
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review1_marks
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review1_group_responses
+    WHERE group_id = gid;
+
+    SELECT reviewer1, reviewer2, guide
+    FROM panel_assignments
+    WHERE group_id = gid;
+END //
+DELIMITER ;
+
+DROP PROCEDURE IF EXISTS sp_review2_bundle;
+DELIMITER //
+CREATE PROCEDURE sp_review2_bundle(IN gid VARCHAR(50))
+COMMENT 'v1'
+BEGIN
+    SELECT group_id, project_title, guide_name, mentor_name, mentor_mobile, mentor_email
+    FROM projects
+    WHERE group_id = gid;
+
+    SELECT roll_no, student_name, contact_details
+    FROM members
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review2_marks
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review2_group_responses
+    WHERE group_id = gid;
+
+    SELECT reviewer1, reviewer2, guide
+    FROM panel_assignments
+    WHERE group_id = gid;
+END //
+DELIMITER ;
+
+DROP PROCEDURE IF EXISTS sp_review3_bundle;
+DELIMITER //
+CREATE PROCEDURE sp_review3_bundle(IN gid VARCHAR(50))
+COMMENT 'v1'
+BEGIN
+    SELECT group_id, project_title, guide_name, mentor_name, mentor_mobile, mentor_email
+    FROM projects
+    WHERE group_id = gid;
+
+    SELECT roll_no, student_name, contact_details
+    FROM members
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review3_marks
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review3_group_responses
+    WHERE group_id = gid;
+
+    SELECT reviewer1, reviewer2, guide
+    FROM panel_assignments
+    WHERE group_id = gid;
+END //
+DELIMITER ;
+
+DROP PROCEDURE IF EXISTS sp_review4_bundle;
+DELIMITER //
+CREATE PROCEDURE sp_review4_bundle(IN gid VARCHAR(50))
+COMMENT 'v1'
+BEGIN
+    SELECT group_id, project_title, guide_name, mentor_name, mentor_mobile, mentor_email
+    FROM projects
+    WHERE group_id = gid;
+
+    SELECT roll_no, student_name, contact_details
+    FROM members
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review4_marks
+    WHERE group_id = gid
+    ORDER BY roll_no;
+
+    SELECT * FROM review4_group_responses
+    WHERE group_id = gid;
+
+    SELECT reviewer1, reviewer2, guide
+    FROM panel_assignments
+    WHERE group_id = gid;
+END //
+DELIMITER ;
+
+
+-- Covering indexes for the final summary lookups: filter on group_id, order by
+-- roll_no and read total straight from the index (no table rows, no filesort)
+CREATE INDEX idx_gid_roll ON review1_marks (group_id, roll_no, total);
+CREATE INDEX idx_gid_roll ON review2_marks (group_id, roll_no, total);
+CREATE INDEX idx_gid_roll ON review3_marks (group_id, roll_no, total);
+CREATE INDEX idx_gid_roll ON review4_marks (group_id, roll_no, total);
+CREATE INDEX idx_members_gid_roll ON members (group_id, roll_no);
+
+
 CREATE TABLE users (
     id INT AUTO_INCREMENT PRIMARY KEY,
     username VARCHAR(50) UNIQUE NOT NULL,
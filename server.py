@@ -1,5 +1,6 @@
 # server.py
 from flask import Flask, render_template, redirect, session
+from jinja2 import FileSystemBytecodeCache
 import os
 from dotenv import load_dotenv
 load_dotenv()
@@ -13,6 +14,25 @@ from backend.pdf_api import pdf_bp
 app = Flask(__name__, template_folder='frontend/templates', static_folder='frontend/static')
 
 
+# Templates don't change in production: skip Jinja's per-render mtime checks and
+# keep compiled template bytecode on disk so new workers don't recompile them
+if not app.debug:
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    jinja_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.jinja_cache')
+    os.makedirs(jinja_cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+
+# Page templates resolved once at startup (by name in debug, so edits still reload)
+_VALID_REVIEWS = frozenset(range(6))
+PAGE_TEMPLATES = [f'review{n}.html' for n in sorted(_VALID_REVIEWS)]
+_page_templates = {} if app.debug else {name: app.jinja_env.get_template(name) for name in PAGE_TEMPLATES}
+
+
+def page(name):
+    """Template to render for a page: the preloaded Template object when there is one"""
+    return _page_templates.get(name, name)
+
+
 # Set secret key for sessions
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-change-this-in-production-2024')
 
@@ -48,14 +68,14 @@ def inject_user_role():
 @app.route('/')
 @login_required
 def home():
-    return render_template('review1.html')
+    return render_template(page('review1.html'))
 
 @app.route('/review<int:review_num>')
 @app.route('/review/<int:review_num>')
 @login_required
 def review_page(review_num):
-    if 0 <= review_num <= 5:
-        return render_template(f'review{review_num}.html')
+    if review_num in _VALID_REVIEWS:
+        return render_template(page(f'review{review_num}.html'))
     return redirect("/")
 
 @app.route('/data-manager')
@@ -74,7 +94,7 @@ def pdf_viewer_page():
 def not_found_error(error):
     if 'user_id' not in session:
         return redirect('/auth/login')
-    return render_template('review1.html'), 404
+    return render_template(page('review1.html')), 404
 
 @app.errorhandler(500)
 def internal_error(error):
@@ -112,25 +132,35 @@ if __name__ == '__main__':
     port = int(os.getenv('PORT', '5000'))
     debug = os.getenv('FLASK_DEBUG', '0') == '1'
 
-    # Initialize default users
-    try:
-        auth.initialize_default_users()
-        print("✅ Default users initialized")
-    except Exception as e:
-        print(f"⚠️ Could not initialize default users: {e}")
-
-    # Optional: test DB connection on startup (non-fatal on failure)
-    conn = get_connection()
-    if conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT DATABASE();")
-        db = cursor.fetchone()
-        print(f"✅ Connected to database: {db[0]}")
-        close_connection(conn)
-    else:
-        print("❌ Database connection failed at startup!")
+    # Initialize default users (opt-in, so restarts and rolling deploys don't repeat the write)
+    if os.getenv('INIT_DEFAULT_USERS') == '1':
+        try:
+            auth.initialize_default_users()
+            print("✅ Default users initialized")
+        except Exception as e:
+            print(f"⚠️ Could not initialize default users: {e}")
+
+    # Debug only: test DB connection on startup (non-fatal on failure)
+    if debug:
+        conn = get_connection()
+        if conn:
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT DATABASE();")
+                db = cursor.fetchone()
+                print(f"✅ Connected to database: {db[0]}")
+            finally:
+                close_connection(conn)
+        else:
+            print("❌ Database connection failed at startup!")
 
     print(f"🚀 Server running on {host}:{port}")
     print(f"🔐 Login at: http://{host}:{port}/auth/login")
     
-    app.run(host=host, port=port, debug=debug, threaded=True)
\ No newline at end of file
+    if debug:
+        app.run(host=host, port=port, debug=debug, threaded=True)
+    else:
+        # Production: serve with waitress instead of the development server
+        from waitress import serve
+        threads = int(os.getenv('SERVER_THREADS', max(8, (os.cpu_count() or 1) * 2)))
+        serve(app, host=host, port=port, threads=threads)